@@ -1,7 +1,9 @@
+import hashlib
 import unittest
-import psycopg2
+import psycopg
+from psycopg import sql
 import os
-from datetime import datetime, timezone
+from datetime import datetime, timedelta, timezone
 
 # Configuration
 DB_DSN = os.environ.get(
@@ -9,16 +11,49 @@ DB_DSN = os.environ.get(
 )
 SQL_FILE_PATH = os.path.join(os.path.dirname(__file__), "../chrono_id.sql")
 
+# Read once at import; setUpClass only sends it when the installed copy differs.
+with open(SQL_FILE_PATH, "r") as f:
+    SQL_BLOB = f.read()
+INSTALLED_MARK = "chrono_id.sql sha256:" + hashlib.sha256(SQL_BLOB.encode()).hexdigest()
+
+# The last function defined in chrono_id.sql carries the hash of the script
+# that installed it, so an edited chrono_id.sql is always reloaded (the script
+# is all CREATE OR REPLACE, so reloading is safe).
+PROBE_FUNCTION = "uchrono64us_from_iso(text)"
+INSTALLED_HASH_SQL = (
+    f"SELECT obj_description(to_regprocedure('{PROBE_FUNCTION}'), 'pg_proc')"
+)
+MARK_INSTALLED_SQL = sql.SQL("COMMENT ON FUNCTION {} IS {}").format(
+    sql.SQL(PROBE_FUNCTION), sql.Literal(INSTALLED_MARK)
+)
+
+# Constant SQL text (values bound as parameters) so the server-side prepared
+# statement is reused across calls.
+ISO_ROUNDTRIP_SQL = "SELECT chrono64ms_get_time(chrono64ms_from_iso(%s))"
+
+
+def insert_ids_copy(cur, table, column, ids):
+    """Bulk-loads BIGINT ids through binary COPY instead of per-row INSERTs."""
+    stmt = sql.SQL("COPY {} ({}) FROM STDIN (FORMAT BINARY)").format(
+        sql.Identifier(table), sql.Identifier(column)
+    )
+    with cur.copy(stmt) as cp:
+        cp.set_types(["bigint"])
+        for i in ids:
+            cp.write_row((int(i),))
+
 class TestChronoIDPostgres(unittest.TestCase):
     @classmethod
     def setUpClass(cls):
         try:
-            cls.conn = psycopg2.connect(DB_DSN)
-            cls.conn.autocommit = True
+            # prepare_threshold=1: prepare server-side from the second execution on.
+            cls.conn = psycopg.connect(DB_DSN, autocommit=True, prepare_threshold=1)
             cls.cursor = cls.conn.cursor()
 
-            with open(SQL_FILE_PATH, "r") as f:
-                cls.cursor.execute(f.read())
+            cls.cursor.execute(INSTALLED_HASH_SQL)
+            if cls.cursor.fetchone()[0] != INSTALLED_MARK:
+                cls.cursor.execute(SQL_BLOB)
+                cls.cursor.execute(MARK_INSTALLED_SQL)
 
         except Exception as e:
             print(f"Failed to connect or load SQL: {e}")
@@ -40,10 +75,12 @@ class TestChronoIDPostgres(unittest.TestCase):
             "chrono64ms", "uchrono64ms",
             "chrono64us", "uchrono64us"
         ]
-        for func in variants:
+        # Pipeline mode sends every SELECT before waiting on any response.
+        with self.conn.pipeline():
+            cursors = [self.conn.execute(f"SELECT {func}()") for func in variants]
+        for func, cur in zip(variants, cursors):
             with self.subTest(func=func):
-                self.cursor.execute(f"SELECT {func}()")
-                val = self.cursor.fetchone()[0]
+                val = cur.fetchone()[0]
                 self.assertIsNotNone(val)
                 if func.startswith("u") or "64" in func:
                     self.assertIsInstance(val, int) # Bigints come as ints
@@ -64,10 +101,14 @@ class TestChronoIDPostgres(unittest.TestCase):
             ("chrono64us_get_time", 0, 1970),
             ("uchrono64us_get_time", 0, 1970)
         ]
-        for func, val, expected_year in retrievals:
+        with self.conn.pipeline():
+            cursors = [
+                self.conn.execute(f"SELECT {func}(%s)", (val,))
+                for func, val, _ in retrievals
+            ]
+        for (func, _, expected_year), cur in zip(retrievals, cursors):
             with self.subTest(func=func):
-                self.cursor.execute(f"SELECT {func}(%s)", (val,))
-                res = self.cursor.fetchone()[0]
+                res = cur.fetchone()[0]
                 self.assertEqual(res.year, expected_year)
                 # Ensure it returns TIMESTAMPTZ (Python datetime with tzinfo)
                 self.assertIsNotNone(res.tzinfo)
@@ -93,6 +134,41 @@ class TestChronoIDPostgres(unittest.TestCase):
                 diff = abs((now - decoded).total_seconds())
                 self.assertLessEqual(diff, precision + 2) # Buffer for execution time
 
+        # ISO input side: 10k strings through one prepared statement via
+        # pipelined executemany, decoded back at millisecond precision.
+        with self.subTest(gen="chrono64ms_from_iso"):
+            base = datetime(2023, 5, 20, 10, 30, tzinfo=timezone.utc)
+            expected = [base + timedelta(milliseconds=i) for i in range(10_000)]
+            rows = [
+                (dt.isoformat(timespec="milliseconds").replace("+00:00", "Z"),)
+                for dt in expected
+            ]
+
+            cur = self.conn.cursor()
+            cur.executemany(ISO_ROUNDTRIP_SQL, rows, returning=True)
+            decoded = []
+            while True:
+                decoded.append(cur.fetchone()[0])
+                if not cur.nextset():
+                    break
+
+            self.assertEqual(len(decoded), len(expected))
+            for dt, res in zip(expected, decoded):
+                self.assertLessEqual(abs((res - dt).total_seconds()), 0.001)
+
+    def test_bulk_insert_copy(self):
+        # 100k ids generated in one round trip, then streamed back via COPY
+        self.cursor.execute("SELECT chrono64ms() FROM generate_series(1, 100000)")
+        ids = [row[0] for row in self.cursor.fetchall()]
+
+        self.cursor.execute("CREATE TEMP TABLE copy_ids (id BIGINT)")
+        try:
+            insert_ids_copy(self.cursor, "copy_ids", "id", ids)
+            self.cursor.execute("SELECT count(*), min(id), max(id) FROM copy_ids")
+            self.assertEqual(self.cursor.fetchone(), (len(ids), min(ids), max(ids)))
+        finally:
+            self.cursor.execute("DROP TABLE copy_ids")
+
     def test_u_variants_monotonicity(self):
         # Unsigned variants should still be positive BIGINTs in our context
         self.cursor.execute("SELECT uchrono64ms()")
@@ -8,6 +8,12 @@ EXT_PATH = os.path.join(os.path.dirname(__file__), "../build/chrono_id")
 # Note: For loading extensions in Python, the path often needs to be absolute
 ABS_EXT_PATH = os.path.abspath(EXT_PATH)
 
+# SQL text is kept constant so the sqlite3 module's per-connection statement
+# cache can reuse the compiled statement instead of re-preparing it per call.
+GENERIC_VARIANTS = ["32", "u32", "32h", "32m", "32w", "64", "64ms", "64us"]
+GENERIC_NEW_SQL = "SELECT chrono_new(?)"
+WRAPPER_FUNCS = ["chrono32", "uchrono32", "chrono32h", "chrono32m", "chrono32w", "uchrono32w", "chrono64", "chrono64ms", "chrono64us"]
+
 class TestChronoIDSQLite(unittest.TestCase):
     @classmethod
     def setUpClass(cls):
@@ -20,6 +26,9 @@ class TestChronoIDSQLite(unittest.TestCase):
             print(f"Failed to load SQLite extension: {e}")
             raise unittest.SkipTest(f"SQLite extension not loadable: {e}")
 
+        # Build each wrapper's SQL string once instead of per subTest.
+        cls.wrapper_sql = [(f, f"SELECT {f}()") for f in WRAPPER_FUNCS]
+
     @classmethod
     def tearDownClass(cls):
         if hasattr(cls, "conn"):
@@ -27,20 +36,18 @@ class TestChronoIDSQLite(unittest.TestCase):
 
     def test_generic_functions(self):
         # chrono_new(type)
-        variants = ["32", "u32", "32h", "32m", "32w", "64", "64ms", "64us"]
-        for v in variants:
+        for v in GENERIC_VARIANTS:
             with self.subTest(variant=v):
-                self.cursor.execute("SELECT chrono_new(?)", (v,))
+                self.cursor.execute(GENERIC_NEW_SQL, (v,))
                 val = self.cursor.fetchone()[0]
                 self.assertIsNotNone(val)
                 self.assertIsInstance(val, int)
 
     def test_individual_wrappers(self):
         # Individual functions like chrono32() (Postgres naming)
-        wrappers = ["chrono32", "uchrono32", "chrono32h", "chrono32m", "chrono32w", "uchrono32w", "chrono64", "chrono64ms", "chrono64us"]
-        for f in wrappers:
+        for f, sql in self.wrapper_sql:
             with self.subTest(func=f):
-                self.cursor.execute(f"SELECT {f}()")
+                self.cursor.execute(sql)
                 val = self.cursor.fetchone()[0]
                 self.assertIsNotNone(val)
                 self.assertIsInstance(val, int)
@@ -0,0 +1,19 @@
+"""
+Build hook for the optional C accelerator.
+
+All package metadata lives in pyproject.toml. The '_speedups' extension is
+marked optional: if it fails to compile, the pure-Python implementation in
+'chrono_id.core' is used instead.
+"""
+
+from setuptools import Extension, setup
+
+setup(
+    ext_modules=[
+        Extension(
+            "chrono_id._speedups",
+            sources=["src/chrono_id/_speedups.c"],
+            optional=True,
+        )
+    ]
+)
@@ -23,6 +23,7 @@ from .core import (
     EPOCH_2020,
     Persona,
     Generator,
+    VARIANTS,
     # 64-bit variants
     UChrono64mo,
     Chrono64mo,
@@ -72,6 +73,7 @@ __all__ = [
     "EPOCH_2020",
     "Persona",
     "Generator",
+    "VARIANTS",
     "UChrono64mo",
     "Chrono64mo",
     "UChrono64w",
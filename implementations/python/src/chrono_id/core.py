@@ -11,11 +11,26 @@ Key Features:
 - Deterministic extraction of timestamp, node_id, and sequence.
 """
 
-from datetime import datetime, timezone
-import secrets
+from datetime import datetime, timedelta, timezone
+import functools
+import os
+import re
+import struct
 import threading
+import time
 from enum import IntEnum
-from typing import Optional, Dict, List, Type, TypeVar, Union, Any, Callable
+from typing import (
+    Optional,
+    Dict,
+    Iterator,
+    List,
+    Tuple,
+    Type,
+    TypeVar,
+    Union,
+    Any,
+    Callable,
+)
 from .weyl import WEYL_MULTIPLIERS
 
 # --- Precomputed Weyl Cache ---
@@ -42,9 +57,59 @@ def _get_weyl_mults(bits: int) -> List[int]:
     return _WEYL_CACHE[bits]
 
 
+def _require_numpy() -> Any:
+    """
+    Imports numpy on demand.
+
+    numpy is an optional dependency used only by the batch APIs, so the scalar
+    hot path keeps the package dependency-free.
+    """
+    try:
+        import numpy
+    except ImportError:
+        raise ImportError(
+            "Batch generation requires numpy: pip install 'chrono-id[numpy]'"
+        ) from None
+    return numpy
+
+
+# Lazily compiled numba decode kernel: None until first use, False when numba
+# is not installed (the numpy path is used instead).
+_DECODE_KERNEL: Any = None
+
+
+def _numba_decode_kernel() -> Any:
+    """
+    Returns the fused, parallel decode kernel, or None if numba is unavailable.
+
+    Compiled on first call so importing the package never pays numba's JIT cost,
+    and cached on disk so later processes load the machine code instead of
+    recompiling it.
+    """
+    global _DECODE_KERNEL
+    if _DECODE_KERNEL is None:
+        try:
+            import numba
+        except ImportError:
+            _DECODE_KERNEL = False
+        else:
+            import numpy as np
+
+            @numba.njit(parallel=True, cache=True)
+            def _decode(ids, shift, unit_us, base_us, out):  # pragma: no cover
+                for i in numba.prange(ids.size):
+                    out[i] = base_us + np.int64(ids[i] >> shift) * unit_us
+
+            _DECODE_KERNEL = _decode
+    return _DECODE_KERNEL or None
+
+
 # --- Constants ---
 EPOCH_2020 = 1577836800  # Unix timestamp for 2020-01-01T00:00:00Z
 EPOCH_YEAR = 2020
+EPOCH_2020_NS = EPOCH_2020 * 1_000_000_000
+EPOCH_2020_DT = datetime(EPOCH_YEAR, 1, 1, tzinfo=timezone.utc)
+EPOCH_2020_NAIVE = datetime(EPOCH_YEAR, 1, 1)
 
 
 class ChronoError(ValueError):
@@ -92,44 +157,115 @@ def _ts_mo(dt: datetime) -> int:
     return (dt.year - EPOCH_YEAR) * 12 + (dt.month - 1)
 
 
+# Fixed-width precisions bucket exact integers taken from the datetime's
+# timedelta since the epoch: no float timestamp. Units of a second or coarser
+# only need the normalised (days, seconds) pair, since microseconds
+# (0 <= us < 10**6) can never carry into a whole unit.
+def _since_epoch(dt: datetime) -> timedelta:
+    # Naive datetimes are taken as UTC, as in '_ensure_utc'.
+    if dt.tzinfo is None:
+        return dt - EPOCH_2020_NAIVE
+    return dt - EPOCH_2020_DT
+
+
+def _epoch_us(dt: datetime) -> int:
+    d = _since_epoch(dt)
+    return (d.days * 86400 + d.seconds) * 1_000_000 + d.microseconds
+
+
 def _ts_w(dt: datetime) -> int:
-    return (int(dt.timestamp()) - EPOCH_2020) // 604800
+    return _since_epoch(dt).days // 7
 
 
 def _ts_d(dt: datetime) -> int:
-    return (int(dt.timestamp()) - EPOCH_2020) // 86400
+    return _since_epoch(dt).days
 
 
 def _ts_h(dt: datetime) -> int:
-    return (int(dt.timestamp()) - EPOCH_2020) // 3600
+    d = _since_epoch(dt)
+    return d.days * 24 + d.seconds // 3600
 
 
 def _ts_tm(dt: datetime) -> int:
-    return (int(dt.timestamp()) - EPOCH_2020) // 600
+    d = _since_epoch(dt)
+    return d.days * 144 + d.seconds // 600
 
 
 def _ts_m(dt: datetime) -> int:
-    return (int(dt.timestamp()) - EPOCH_2020) // 60
+    d = _since_epoch(dt)
+    return d.days * 1440 + d.seconds // 60
 
 
 def _ts_s(dt: datetime) -> int:
-    return int(dt.timestamp()) - EPOCH_2020
+    d = _since_epoch(dt)
+    return d.days * 86400 + d.seconds
 
 
 def _ts_ds(dt: datetime) -> int:
-    return (int(dt.timestamp()) - EPOCH_2020) * 10 + (dt.microsecond // 100000)
+    return _epoch_us(dt) // 100_000
 
 
 def _ts_cs(dt: datetime) -> int:
-    return (int(dt.timestamp()) - EPOCH_2020) * 100 + (dt.microsecond // 10000)
+    return _epoch_us(dt) // 10_000
 
 
 def _ts_ms(dt: datetime) -> int:
-    return (int(dt.timestamp()) - EPOCH_2020) * 1000 + (dt.microsecond // 1000)
+    return _epoch_us(dt) // 1_000
 
 
 def _ts_us(dt: datetime) -> int:
-    return (int(dt.timestamp()) - EPOCH_2020) * 1000000 + dt.microsecond
+    return _epoch_us(dt)
+
+
+# Marks a string passed to the constructor as formatted/hex rather than decimal
+# (separator or hex letter); one C-level scan instead of a per-character loop.
+_FORMATTED_HINT = re.compile("[- a-fA-F]").search
+
+# Cheap pre-check for 'from_iso_string'/'from_iso_batch', compiled once: every
+# date 'fromisoformat' accepts starts with a four-digit ASCII year followed by
+# '-', a digit (basic 'YYYYMMDD') or 'W' (ISO week). Anything else is rejected
+# without entering the parsers; nothing 'fromisoformat' accepts is narrowed.
+_ISO_RE = re.compile(r"\d{4}[-W\d]", re.ASCII)
+
+
+def _fast_parse_iso(iso: str) -> Optional[datetime]:
+    """
+    Parses the canonical 'YYYY-MM-DDTHH:MM:SS[.fff|.ffffff]Z' shapes directly.
+
+    Fixed-width slicing avoids the 'Z' replacement and the general-purpose
+    'fromisoformat' parser. Returns None for any other shape (or an
+    out-of-range field) so the caller can fall back to the general parser.
+    """
+    n = len(iso)
+    if n not in (20, 24, 27) or iso[-1] != "Z" or not iso.isascii():
+        return None
+    if (
+        iso[4] != "-"
+        or iso[7] != "-"
+        or iso[10] != "T"
+        or iso[13] != ":"
+        or iso[16] != ":"
+        or (n != 20 and iso[19] != ".")
+    ):
+        return None
+    fields = iso[0:4] + iso[5:7] + iso[8:10] + iso[11:13] + iso[14:16] + iso[17:19]
+    frac = iso[20:-1]
+    if not fields.isdigit() or (frac and not frac.isdigit()):
+        return None
+    us = int(frac) * 1000 if n == 24 else int(frac or 0)
+    try:
+        return datetime(
+            int(iso[0:4]),
+            int(iso[5:7]),
+            int(iso[8:10]),
+            int(iso[11:13]),
+            int(iso[14:16]),
+            int(iso[17:19]),
+            us,
+            tzinfo=timezone.utc,
+        )
+    except ValueError:
+        return None
 
 
 def _ensure_utc(dt: datetime) -> datetime:
@@ -138,11 +274,60 @@ def _ensure_utc(dt: datetime) -> datetime:
     If naive, it is assumed to be UTC (to maintain cross-platform parity).
     If aware, it is converted to UTC.
     """
-    if dt.tzinfo is None:
+    tz = dt.tzinfo
+    if tz is timezone.utc:
+        # Already normalised: skip the copy 'astimezone' would make.
+        return dt
+    if tz is None:
         return dt.replace(tzinfo=timezone.utc)
     return dt.astimezone(timezone.utc)
 
 
+@functools.lru_cache(maxsize=1024)
+def _parse_iso(iso: str) -> datetime:
+    """
+    Parses an ISO 8601 string into a UTC datetime: the fixed-width fast path
+    for canonical shapes, 'fromisoformat' for everything else.
+
+    Memoized: log replay and dedup workloads feed the same timestamps
+    repeatedly, and datetimes are immutable, so results are safe to share.
+    Only the parse is cached; ID generation stays stateful per call.
+    """
+    dt = _fast_parse_iso(iso)
+    if dt is None:
+        try:
+            dt = datetime.fromisoformat(iso.replace("Z", "+00:00"))
+        except ValueError:
+            raise ChronoError("Invalid ISO 8601 format")
+    return _ensure_utc(dt)
+
+
+# Nanoseconds per time unit for fixed-width precisions, indexed by Precision.
+# Calendar precisions (Y/HY/Q/MO) have variable-length units and map to 0.
+UNIT_NS: List[int] = [
+    0,
+    0,
+    0,
+    0,
+    604800 * 1_000_000_000,
+    86400 * 1_000_000_000,
+    3600 * 1_000_000_000,
+    600 * 1_000_000_000,
+    60 * 1_000_000_000,
+    1_000_000_000,
+    100_000_000,
+    10_000_000,
+    1_000_000,
+    1_000,
+]
+
+# Months per time unit for calendar precisions (Y/HY/Q/MO), indexed by
+# Precision; 0 for fixed-width precisions.
+UNIT_MONTHS: List[int] = [12, 6, 3, 1] + [0] * 10
+
+NS_PER_DAY = 86400 * 1_000_000_000
+
+
 # Array-based dispatch for O(1) timestamp computation.
 TS_COMPUTE: List[Callable[[datetime], int]] = [
     _ts_y,
@@ -162,50 +347,65 @@ TS_COMPUTE: List[Callable[[datetime], int]] = [
 ]
 
 
-def _rev_y(ts: int) -> float:
-    return datetime(EPOCH_YEAR + ts, 1, 1, tzinfo=timezone.utc).timestamp()
+def _days_from_civil(year: int, month: int, day: int) -> int:
+    """
+    Converts a proleptic Gregorian date to days since 1970-01-01.
+
+    Integer-only port of Howard Hinnant's 'days_from_civil' algorithm
+    (the inverse of '_civil_from_days').
+    """
+    year -= month <= 2
+    era = year // 400
+    yoe = year - era * 400
+    doy = (153 * (month - 3 if month > 2 else month + 9) + 2) // 5 + day - 1
+    doe = yoe * 365 + yoe // 4 - yoe // 100 + doy
+    return era * 146097 + doe - 719468
+
+
+# Calendar buckets all start on the 1st of a month: decode them as a month
+# count from 2020-01 straight to Unix seconds, with no datetime round-trip.
+def _rev_months(months: int) -> int:
+    return _days_from_civil(EPOCH_YEAR + months // 12, months % 12 + 1, 1) * 86400
+
+
+def _rev_y(ts: int) -> int:
+    return _rev_months(ts * 12)
 
 
-def _rev_hy(ts: int) -> float:
-    return datetime(
-        EPOCH_YEAR + (ts // 2), 1 if (ts % 2 == 0) else 7, 1, tzinfo=timezone.utc
-    ).timestamp()
+def _rev_hy(ts: int) -> int:
+    return _rev_months(ts * 6)
 
 
-def _rev_q(ts: int) -> float:
-    return datetime(
-        EPOCH_YEAR + (ts // 4), ((ts % 4) * 3) + 1, 1, tzinfo=timezone.utc
-    ).timestamp()
+def _rev_q(ts: int) -> int:
+    return _rev_months(ts * 3)
 
 
-def _rev_mo(ts: int) -> float:
-    return datetime(
-        EPOCH_YEAR + (ts // 12), (ts % 12) + 1, 1, tzinfo=timezone.utc
-    ).timestamp()
+def _rev_mo(ts: int) -> int:
+    return _rev_months(ts)
 
 
-def _rev_w(ts: int) -> float:
-    return float(EPOCH_2020 + (ts * 604800))
+def _rev_w(ts: int) -> int:
+    return EPOCH_2020 + (ts * 604800)
 
 
-def _rev_d(ts: int) -> float:
-    return float(EPOCH_2020 + (ts * 86400))
+def _rev_d(ts: int) -> int:
+    return EPOCH_2020 + (ts * 86400)
 
 
-def _rev_h(ts: int) -> float:
-    return float(EPOCH_2020 + (ts * 3600))
+def _rev_h(ts: int) -> int:
+    return EPOCH_2020 + (ts * 3600)
 
 
-def _rev_tm(ts: int) -> float:
-    return float(EPOCH_2020 + (ts * 600))
+def _rev_tm(ts: int) -> int:
+    return EPOCH_2020 + (ts * 600)
 
 
-def _rev_m(ts: int) -> float:
-    return float(EPOCH_2020 + (ts * 60))
+def _rev_m(ts: int) -> int:
+    return EPOCH_2020 + (ts * 60)
 
 
-def _rev_s(ts: int) -> float:
-    return float(EPOCH_2020 + ts)
+def _rev_s(ts: int) -> int:
+    return EPOCH_2020 + ts
 
 
 def _rev_ds(ts: int) -> float:
@@ -243,18 +443,209 @@ TS_REVERSE: List[Callable[[int], float]] = [
 ]
 
 
+@functools.lru_cache(maxsize=4096)
+def _bucket_time(precision: int, ts_val: int) -> datetime:
+    """
+    Decodes a time bucket of the given precision to its UTC start instant.
+
+    Memoized: table scans decode many IDs sharing a bucket, and datetimes are
+    immutable, so one instance per (precision, bucket) is safe to share.
+    """
+    unit_ns = UNIT_NS[precision]
+    if unit_ns:
+        # Fixed-width units decode with exact integer microseconds,
+        # avoiding float rounding of large sub-second timestamps.
+        return EPOCH_2020_DT + timedelta(microseconds=(ts_val * unit_ns) // 1000)
+    return datetime.fromtimestamp(TS_REVERSE[precision](ts_val), tz=timezone.utc)
+
+
+def _pack(
+    ts_val: int,
+    node_id: int,
+    seq: int,
+    n_mult: int,
+    n_salt: int,
+    s_mult: int,
+    s_salt: int,
+    seq_offset: int,
+    t_mask: int,
+    n_mask: int,
+    s_mask: int,
+    t_shift: int,
+    s_bits: int,
+) -> int:
+    """
+    Assembles the raw ID value using the inlined Weyl-Golden mixer.
+
+    Pure-Python reference for the optional C accelerator in '_speedups'.
+    """
+    mix_n = ((node_id * n_mult) ^ n_salt) & n_mask
+    s_val = (seq + seq_offset) & s_mask
+    mix_s = ((s_val * s_mult) ^ s_salt) & s_mask
+    return ((ts_val & t_mask) << t_shift) | (mix_n << s_bits) | mix_s
+
+
+try:
+    from ._speedups import pack as _pack_native
+except ImportError:
+    _pack_native = None
+
+# Hot-path assembler: native uint64 arithmetic when the extension is built.
+_PACK: Callable[..., int] = _pack_native or _pack
+
+# Per-variant '_pack_persona' templates, compiled in ChronoBase.__init_subclass__
+# with the variant's masks and shifts baked in as literals.
+_PACK_PERSONA_NATIVE_SRC = """
+def _pack_persona(ts_val, node_id, seq, persona):
+    return _pack_native(
+        ts_val, node_id, seq,
+        N_MULT[persona.node_idx], persona.node_salt,
+        S_MULT[persona.seq_idx], persona.seq_salt, persona.seq_offset,
+        {t_mask}, {n_mask}, {s_mask}, {t_shift}, {s_bits},
+    )
+"""
+
+_PACK_PERSONA_PY_SRC = """
+def _pack_persona(ts_val, node_id, seq, persona):
+    mix_n = ((node_id * N_MULT[persona.node_idx]) ^ persona.node_salt) & {n_mask}
+    s_val = (seq + persona.seq_offset) & {s_mask}
+    mix_s = ((s_val * S_MULT[persona.seq_idx]) ^ persona.seq_salt) & {s_mask}
+    return ((ts_val & {t_mask}) << {t_shift}) | (mix_n << {s_bits}) | mix_s
+"""
+
+
+def _compile_pack_persona(cls: Type["ChronoBase"]) -> Callable[..., int]:
+    """Builds a '_pack_persona' for 'cls' with its layout constants inlined."""
+    src = _PACK_PERSONA_NATIVE_SRC if _pack_native else _PACK_PERSONA_PY_SRC
+    namespace = {
+        "N_MULT": cls.N_MULT,
+        "S_MULT": cls.S_MULT,
+        "_pack_native": _pack_native,
+    }
+    exec(
+        src.format(
+            t_mask=cls.T_MASK,
+            n_mask=cls.N_MASK,
+            s_mask=cls.S_MASK,
+            t_shift=cls.T_SHIFT,
+            s_bits=cls.S_BITS,
+        ),
+        namespace,
+    )
+    return namespace["_pack_persona"]
+
+
+def _civil_from_days(days: int) -> Tuple[int, int, int]:
+    """
+    Converts days since 1970-01-01 to a proleptic Gregorian (year, month, day).
+
+    Integer-only port of Howard Hinnant's 'civil_from_days' algorithm.
+    """
+    z = days + 719468
+    era = z // 146097
+    doe = z - era * 146097
+    yoe = (doe - doe // 1460 + doe // 36524 - doe // 146096) // 365
+    doy = doe - (365 * yoe + yoe // 4 - yoe // 100)
+    mp = (5 * doy + 2) // 153
+    d = doy - (153 * mp + 2) // 5 + 1
+    m = mp + 3 if mp < 10 else mp - 9
+    return yoe + era * 400 + (m <= 2), m, d
+
+
+# Single-entry (day, months since epoch) cache: the civil date only changes
+# once a day, so calendar-precision generation skips the conversion. Stored
+# as one immutable tuple so concurrent readers always see a matching pair.
+_MONTHS_CACHE: Tuple[int, int] = (-1, 0)
+
+
+def _months_since_epoch(days: int) -> int:
+    """Returns whole months between 2020-01 and the month containing 'days'."""
+    global _MONTHS_CACHE
+    cached = _MONTHS_CACHE
+    if cached[0] == days:
+        return cached[1]
+    year, month, _ = _civil_from_days(days)
+    months = (year - EPOCH_YEAR) * 12 + month - 1
+    _MONTHS_CACHE = (days, months)
+    return months
+
+
+def weyl_mix(v: int, mask: int, mult: int, salt: int) -> int:
+    """
+    Implements the Weyl self-healing mixing logic for one segment.
+    Uses large primes (multipliers) to distribute bits across the suffix space.
+
+    Reference form only: the packing hot paths inline this expression.
+    """
+    return ((v * mult) ^ salt) & mask
+
+
 class WeylMixer:
     """
     Implements the Weyl self-healing mixing logic.
     Uses large primes (multipliers) to distribute bits across the suffix space.
     """
 
-    @staticmethod
-    def mix(v: int, mask: int, mult: int, salt: int) -> int:
-        """
-        High-performance mix using precomputed values.
-        """
-        return ((v * mult) ^ salt) & mask
+    # The plain function, so 'WeylMixer.mix' dispatches as cheaply as 'weyl_mix'.
+    mix = staticmethod(weyl_mix)
+
+
+# --- Buffered Entropy ---
+# Each thread draws CSPRNG bytes from os.urandom in 4 KiB blocks, amortizing
+# the syscall over hundreds of IDs. Bits are handed out from a small integer
+# reservoir via shift+mask, so a 10-bit draw consumes 10 bits, not 2 bytes.
+_ENTROPY_BLOCK = 4096
+
+
+class _BitPool:
+    """Pool of os.urandom bits owned by a single thread."""
+
+    __slots__ = ("raw", "pos", "acc", "bits")
+
+    def __init__(self) -> None:
+        self.raw = b""
+        self.pos = 0
+        self.acc = 0
+        self.bits = 0
+
+    def take(self, n: int) -> int:
+        """Returns a CSPRNG integer of 'n' bits, refilling 64 bits at a time."""
+        acc = self.acc
+        bits = self.bits
+        while bits < n:
+            pos = self.pos
+            if pos + 8 > len(self.raw):
+                self.raw = os.urandom(_ENTROPY_BLOCK)
+                pos = 0
+            acc |= int.from_bytes(self.raw[pos : pos + 8], "little") << bits
+            bits += 64
+            self.pos = pos + 8
+        self.acc = acc >> n
+        self.bits = bits - n
+        return acc & ((1 << n) - 1)
+
+
+# Plain slotted pools behind one threading.local lookup: attribute access on a
+# threading.local subclass is markedly slower than on a __slots__ object.
+_ENTROPY = threading.local()
+
+
+def _randbits(bits: int) -> int:
+    """Returns a CSPRNG integer of 'bits' bits from the thread's bit pool."""
+    try:
+        pool = _ENTROPY.pool
+    except AttributeError:
+        pool = _ENTROPY.pool = _BitPool()
+    return pool.take(bits)
+
+
+def _reset_entropy() -> None:
+    """Discards buffered bits so a forked child never replays its parent's."""
+    _ENTROPY.pool = _BitPool()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_entropy)
 
 
 class Persona:
@@ -294,12 +685,13 @@ class Persona:
 
     def _reseed(self, s_bits: int, ts: Optional[float] = None) -> None:
         """
-        Internal worker that fetches 128-bits of entropy and splits it.
+        Internal worker that fetches one block of entropy and splits it.
 
-        This method minimizes calls to 'secrets.randbits' by pulling all required
-        entropy for node ID, multipliers, and sequence offsets in a single pass.
+        This method minimizes entropy draws by pulling all required entropy
+        for node ID, multipliers, and sequence offsets in a single pass:
+        62 bits of fixed fields plus 's_bits' for the sequence offset.
         """
-        pool = secrets.randbits(128)
+        pool = _randbits(62 + s_bits)
         self.node_id = pool & 0xFFFF  # 16-bit Node ID
         self.node_salt = (pool >> 16) & 0xFFFF  # 16-bit Node Salt
         self.node_idx = (pool >> 32) & 0x7F  # 7-bit Multiplier Index
@@ -308,11 +700,10 @@ class Persona:
 
         # Sequence offset matches the bit-width of the variant to ensure
         # that even when sequence is reset to 0, personas start from different points.
-        offset_mask = (1 << s_bits) - 1 if s_bits > 0 else 0
-        self.seq_offset = (pool >> 62) & offset_mask
-        self.last_rotate = (
-            ts if ts is not None else datetime.now(timezone.utc).timestamp()
-        )
+        # The draw is exactly 62 + s_bits wide, so the top bits need no mask.
+        self.seq_offset = pool >> 62
+        # time.time() is the same POSIX clock without building a datetime.
+        self.last_rotate = ts if ts is not None else time.time()
 
 
 # --- Thread-Local Storage ---
@@ -338,11 +729,16 @@ class GeneratorState:
 
 def _get_thread_state(cls: Type["ChronoBase"]) -> GeneratorState:
     """Retrieves or initializes generator state for the current thread."""
-    if not hasattr(_TLS, "states"):
-        _TLS.states = {}
-    if cls not in _TLS.states:
-        _TLS.states[cls] = GeneratorState(cls)
-    return _TLS.states[cls]
+    try:
+        return _TLS.states[cls]
+    except (AttributeError, KeyError):
+        # First call on this thread (no 'states' yet) or first use of 'cls'.
+        try:
+            states = _TLS.states
+        except AttributeError:
+            states = _TLS.states = {}
+        state = states[cls] = GeneratorState(cls)
+        return state
 
 
 class Generator:
@@ -372,47 +768,82 @@ class Generator:
         self.persona = persona or Persona(s_bits=self.cls.S_BITS)
         self.last_ts = 0
         self.sequence = 0
-        self.seq_mask = (1 << self.cls.S_BITS) - 1 if self.cls.S_BITS > 0 else 0
+        self.seq_mask = cls.S_MASK
 
     def generate(self, dt: Optional[datetime] = None) -> "ChronoBase":
         """Generates a unique ID, incrementing sequence if in the same time window."""
+        cls = self.cls
         if dt is None:
-            dt = datetime.now(timezone.utc)
+            # Same wall-clock fast path as 'ChronoBase.generate_int': bucket
+            # integer nanoseconds without building a datetime.
+            ns = time.time_ns()
+            ts_unix = ns / 1e9
+            if cls.UNIT_NS:
+                ts = (ns - EPOCH_2020_NS) // cls.UNIT_NS
+            else:
+                ts = _months_since_epoch(ns // NS_PER_DAY) // cls.UNIT_MONTHS
         else:
             dt = _ensure_utc(dt)
-        ts_unix = dt.timestamp()
-        ts = TS_COMPUTE[self.cls.PRECISION](dt)
-
-        if ts > self.last_ts:
+            ts_unix = dt.timestamp()
+            # Checked before any state update so a rejected date leaves it intact.
+            if ts_unix < EPOCH_2020:
+                raise ChronoError(
+                    "Timestamp underflow: Date is before Epoch (2020-01-01)"
+                )
+            ts = cls._ts_compute(dt)
+
+        # Same-bucket is the hot case at fine precisions: test it first, and
+        # keep last_ts/sequence/persona in locals so each is loaded once.
+        persona = self.persona
+        last_ts = self.last_ts
+        if ts == last_ts:
+            seq = (self.sequence + 1) & self.seq_mask
+            if seq == 0:
+                persona.rotate(cls.S_BITS)  # Overflow rotation
+        elif ts > last_ts:
             self.last_ts = ts
-            self.sequence = 0
-        elif ts == self.last_ts:
-            self.sequence = (self.sequence + 1) & self.seq_mask
-            if self.sequence == 0:
-                self.persona.rotate(self.cls.S_BITS)  # Overflow rotation
+            seq = 0
         else:
             # ROLLBACK DETECTED: ts < last_ts
             # Force rotation to ensure uniqueness even if coordinates are reused.
-            self.persona.rotate(self.cls.S_BITS)
-            self.sequence = (self.sequence + 1) & self.seq_mask
+            persona.rotate(cls.S_BITS)
+            seq = (self.sequence + 1) & self.seq_mask
+        self.sequence = seq
 
         # Automatic rotation for Mode A every 60 seconds
-        if ts_unix - self.persona.last_rotate > 60:
-            self.persona._reseed(self.cls.S_BITS, ts=ts_unix)
+        if ts_unix - persona.last_rotate > 60:
+            persona._reseed(cls.S_BITS, ts=ts_unix)
 
-        return self.cls.from_persona(
-            dt, self.persona.node_id, self.sequence, self.persona, ts=ts
-        )
+        # dt is already validated and bucketed: pack directly instead of
+        # going through 'from_persona', which would re-check the epoch.
+        return int.__new__(cls, cls._pack_persona(ts, persona.node_id, seq, persona))
+
+    def generate_many(self, n: int, dt: Optional[datetime] = None) -> Any:
+        """
+        Generates 'n' IDs in a single vectorised pass (requires numpy).
+
+        Equivalent to calling 'generate(dt)' n times on this generator, with the
+        mixing done over the whole batch. Returns a numpy uint64 array of raw
+        ID values; wrap with 'cls.from_array()' if objects are needed.
+        """
+        return self.cls._generate_batch(self, n, dt)
 
 
 T = TypeVar("T", bound="ChronoBase")
 
+# Registry of every defined variant, keyed by lowercase class name (the naming
+# used by the cross-platform test vectors). Filled in ChronoBase.__init_subclass__.
+VARIANTS: Dict[str, Type["ChronoBase"]] = {}
+
 
 class ChronoBase(int):
     """
     Base class for all Chrono-ID variants. Inherits from 'int' for transparent usage.
     """
 
+    # IDs are plain ints: no per-instance __dict__ on the base or any variant.
+    __slots__ = ()
+
     PRECISION: Precision = Precision.S
     T_BITS: int = 0
     N_BITS: int = 0
@@ -424,6 +855,15 @@ class ChronoBase(int):
     N_MASK: int = 0  # Precomputed mask for Node segment
     S_MASK: int = 0  # Precomputed mask for Sequence segment
     T_SHIFT: int = 0  # Precomputed shift (N_BITS + S_BITS) to align timestamp
+    UNIT_NS: int = 0  # Nanoseconds per time unit (0 for calendar precisions)
+    UNIT_MONTHS: int = 0  # Months per time unit (0 for fixed-width precisions)
+    # Bitfield descriptor (T_MASK, N_MASK, S_MASK, T_SHIFT, S_BITS), the trailing
+    # arguments of '_pack', so assembly reads one class attribute instead of five.
+    LAYOUT: Tuple[int, int, int, int, int] = (0, 0, 0, 0, 0)
+    BYTE_WIDTH: int = 8  # Wire width: 4 for the 32-bit family, 8 for 64-bit
+    # TS_COMPUTE/TS_REVERSE entries for PRECISION (rebound per variant)
+    _ts_compute = staticmethod(_ts_s)
+    _ts_reverse = staticmethod(_rev_s)
     N_MULT: List[int] = []  # Cache pointer to odd-prime multipliers for Node segment
     S_MULT: List[int] = (
         []
@@ -438,29 +878,46 @@ class ChronoBase(int):
         hot path contains zero addition, subtraction, or shift-calculation logic.
         """
         super().__init_subclass__(**kwargs)
-        cls.T_MASK = (1 << cls.T_BITS) - 1 if cls.T_BITS > 0 else 0
-        cls.N_MASK = (1 << cls.N_BITS) - 1 if cls.N_BITS > 0 else 0
-        cls.S_MASK = (1 << cls.S_BITS) - 1 if cls.S_BITS > 0 else 0
+        # ~(-1 << bits) is the low-'bits' mask, and 0 for a zero-width segment.
+        cls.T_MASK = ~(-1 << cls.T_BITS)
+        cls.N_MASK = ~(-1 << cls.N_BITS)
+        cls.S_MASK = ~(-1 << cls.S_BITS)
         cls.T_SHIFT = cls.N_BITS + cls.S_BITS
+        cls.UNIT_NS = UNIT_NS[cls.PRECISION]
+        cls.UNIT_MONTHS = UNIT_MONTHS[cls.PRECISION]
+        # Precision is fixed per class: bind the bucket/reverse helpers once.
+        cls._ts_compute = staticmethod(TS_COMPUTE[cls.PRECISION])
+        cls._ts_reverse = staticmethod(TS_REVERSE[cls.PRECISION])
+        cls.LAYOUT = (cls.T_MASK, cls.N_MASK, cls.S_MASK, cls.T_SHIFT, cls.S_BITS)
+
+        # Tiered width: 32-bit family vs 64-bit family (sign bit included).
+        width = cls.T_BITS + cls.N_BITS + cls.S_BITS + (1 if cls.SIGNED else 0)
+        cls.BYTE_WIDTH = 8 if width > 32 else 4
+        cls._pack_le = staticmethod(
+            struct.Struct("<Q" if cls.BYTE_WIDTH == 8 else "<I").pack
+        )
 
         # Multipliers are pulled from a shared global pool to optimize memory.
         cls.N_MULT = _get_weyl_mults(cls.N_BITS)
         cls.S_MULT = _get_weyl_mults(cls.S_BITS)
 
+        # Specialized assembler: no class attribute loads on the hot path.
+        cls._pack_persona = staticmethod(_compile_pack_persona(cls))
+        VARIANTS[cls.__name__.lower()] = cls
+
     def __new__(cls: Type[T], value: Optional[Union[int, str]] = None) -> T:
         """Constructs a Chrono-ID from an integer value or hex/hyphenated string."""
+        if type(value) is int:
+            # Wrapping an existing raw value is the common case: no dispatch.
+            return int.__new__(cls, value)
         if value is None:
             return cls.generate()
-        if isinstance(value, str) and (
-            "-" in value or " " in value or any(c in "abcdefABCDEF" for c in value)
-        ):
+        if isinstance(value, str) and _FORMATTED_HINT(value):
             # If it looks like a formatted string (hyphens, spaces, or hex chars),
-            # use the formatted parser.
-            try:
-                return cls.from_formatted(value)
-            except (ValueError, ChronoError):
-                # Fallback to decimal parsing if it's just a numeric string
-                pass
+            # use the formatted parser. No decimal fallback is needed: any
+            # string int() accepts in base 10 also parses once separators are
+            # stripped, and ChronoError is a ValueError for callers.
+            return cls.from_formatted(value)
         return super().__new__(cls, int(value))
 
     @classmethod
@@ -473,7 +930,7 @@ class ChronoBase(int):
             raise ChronoError("Input string is null")
         clean = formatted.replace("-", "").replace(" ", "")
         try:
-            return cls(int(clean, 16))
+            return int.__new__(cls, int(clean, 16))
         except ValueError:
             raise ChronoError(f"Invalid hex format for {cls.__name__}: {formatted}")
 
@@ -491,33 +948,60 @@ class ChronoBase(int):
         Thread-safe: Uses thread-local storage if no persona is provided.
         Note: For high-frequency use, use the 'Generator' class for stateful uniqueness.
         """
+        return int.__new__(cls, cls.generate_int(dt, node_id, seq, persona))
+
+    @classmethod
+    def generate_int(
+        cls,
+        dt: Optional[datetime] = None,
+        node_id: Optional[int] = None,
+        seq: Optional[int] = None,
+        persona: Optional[Persona] = None,
+    ) -> int:
+        """
+        Same as 'generate()', but returns the raw value as a plain 'int'.
+
+        Intended for bulk inserts where the ID object is discarded right after
+        use: it skips the int-subclass allocation of the variant wrapper.
+        """
+        ts: Optional[int] = None
         if dt is None:
-            dt = datetime.now(timezone.utc)
+            # Fast path: bucket the wall clock directly from integer
+            # nanoseconds, skipping the datetime round-trip entirely.
+            ns = time.time_ns()
+            ts_unix = ns / 1e9
+            if cls.UNIT_NS:
+                ts = (ns - EPOCH_2020_NS) // cls.UNIT_NS
+            else:
+                # Calendar precisions: count months from the civil date.
+                ts = _months_since_epoch(ns // NS_PER_DAY) // cls.UNIT_MONTHS
         else:
             dt = _ensure_utc(dt)
+            ts_unix = dt.timestamp()
+            if ts_unix < EPOCH_2020:
+                raise ChronoError(
+                    "Timestamp underflow: Date is before Epoch (2020-01-01)"
+                )
 
         if persona is None:
             state = _get_thread_state(cls)
             persona = state.persona
-            ts = TS_COMPUTE[cls.PRECISION](dt)
+            if ts is None:
+                ts = cls._ts_compute(dt)
 
             if ts > state.last_ts:
                 state.last_ts = ts
                 state.sequence = 0
             elif ts == state.last_ts:
-                state.sequence = (state.sequence + 1) & (
-                    (1 << cls.S_BITS) - 1 if cls.S_BITS > 0 else 0
-                )
+                state.sequence = (state.sequence + 1) & cls.S_MASK
                 if state.sequence == 0:
                     persona.rotate(cls.S_BITS)
             else:
                 # Rollback
                 persona.rotate(cls.S_BITS)
-                state.sequence = (state.sequence + 1) & (
-                    (1 << cls.S_BITS) - 1 if cls.S_BITS > 0 else 0
-                )
+                state.sequence = (state.sequence + 1) & cls.S_MASK
 
-            if dt.timestamp() - persona.last_rotate > 60:
+            if ts_unix - persona.last_rotate > 60:
                 persona.rotate(cls.S_BITS)
 
             if node_id is None:
@@ -528,9 +1012,259 @@ class ChronoBase(int):
             if node_id is None:
                 node_id = persona.node_id
             if seq is None:
-                seq = secrets.randbits(cls.S_BITS) if cls.S_BITS > 0 else 0
+                # The bit pool returns 0 for a zero-width draw: no guard needed.
+                seq = _randbits(cls.S_BITS)
+
+        if ts is None:
+            ts = cls._ts_compute(dt)
+        return cls._pack_persona(ts, node_id, seq, persona)
 
-        return cls.from_persona(dt, node_id, seq, persona)
+    @classmethod
+    def generate_many(cls, n: int, dt: Optional[datetime] = None) -> Any:
+        """
+        Generates 'n' IDs in a single vectorised pass (requires numpy).
+
+        Equivalent to calling 'generate(dt)' n times on the current thread: all
+        IDs share one time bucket and consume consecutive sequence values, with
+        the persona rotating whenever the sequence space wraps. The mixing is
+        done with numpy bitwise ops over the whole batch instead of per ID.
+
+        Returns:
+            A numpy.ndarray of dtype uint64 holding the raw ID values.
+        """
+        return cls._generate_batch(_get_thread_state(cls), n, dt)
+
+    @classmethod
+    def _generate_batch(cls, state: Any, n: int, dt: Optional[datetime]) -> Any:
+        """
+        Shared body of the 'generate_many' APIs.
+
+        'state' is anything carrying 'persona', 'last_ts' and 'sequence' (a
+        thread's GeneratorState or a Generator); it advances exactly as n
+        'generate()' calls on that state would.
+        """
+        np = _require_numpy()
+        if dt is None:
+            dt = datetime.now(timezone.utc)
+        else:
+            dt = _ensure_utc(dt)
+        ts_unix = dt.timestamp()
+        if ts_unix < EPOCH_2020:
+            raise ChronoError("Timestamp underflow: Date is before Epoch (2020-01-01)")
+
+        out = np.empty(n, dtype=np.uint64)
+        if n <= 0:
+            return out
+
+        persona = state.persona
+        ts = cls._ts_compute(dt)
+
+        # The first ID follows the same transitions as 'generate()'.
+        if ts > state.last_ts:
+            state.last_ts = ts
+            seq = 0
+        elif ts == state.last_ts:
+            seq = (state.sequence + 1) & cls.S_MASK
+            if seq == 0:
+                persona.rotate(cls.S_BITS)
+        else:
+            # Rollback
+            persona.rotate(cls.S_BITS)
+            seq = (state.sequence + 1) & cls.S_MASK
+
+        if ts_unix - persona.last_rotate > 60:
+            persona.rotate(cls.S_BITS)
+
+        head_ts = (ts & cls.T_MASK) << cls.T_SHIFT
+        pos = 0
+        while True:
+            # Fill the run of sequence values up to the next wrap-around.
+            run = min(n - pos, cls.S_MASK + 1 - seq)
+            mix_n = (
+                (persona.node_id * cls.N_MULT[persona.node_idx]) ^ persona.node_salt
+            ) & cls.N_MASK
+            s_val = np.arange(
+                seq + persona.seq_offset,
+                seq + persona.seq_offset + run,
+                dtype=np.uint64,
+            )
+            s_val &= np.uint64(cls.S_MASK)
+            s_val *= np.uint64(cls.S_MULT[persona.seq_idx])
+            s_val ^= np.uint64(persona.seq_salt)
+            s_val &= np.uint64(cls.S_MASK)
+            s_val |= np.uint64(head_ts | (mix_n << cls.S_BITS))
+            out[pos : pos + run] = s_val
+
+            pos += run
+            seq += run - 1
+            if pos >= n:
+                break
+            persona.rotate(cls.S_BITS)  # Overflow rotation
+            seq = 0
+
+        state.sequence = seq
+        return out
+
+    @classmethod
+    def from_time_batch(
+        cls, n: int, dt: Optional[datetime] = None, random_vals: Any = None
+    ) -> Any:
+        """
+        Vectorised 'from_time(dt, random_val)' for a batch of 'n' IDs (requires numpy).
+
+        All entropy comes from a single os.urandom call unless 'random_vals' (an
+        array of exactly 'n' combined node/sequence values) is given. Node and sequence
+        segments are mixed with the current thread's persona over the whole
+        batch; the thread's sequence counter is left untouched.
+
+        Returns:
+            A numpy.ndarray of dtype uint64 holding the raw ID values.
+        """
+        np = _require_numpy()
+        if dt is None:
+            dt = datetime.now(timezone.utc)
+        else:
+            dt = _ensure_utc(dt)
+        if dt.timestamp() < EPOCH_2020:
+            raise ChronoError("Timestamp underflow: Date is before Epoch (2020-01-01)")
+        ts = cls._ts_compute(dt)
+        return cls._mix_batch(
+            np.uint64((ts & cls.T_MASK) << cls.T_SHIFT), n, random_vals
+        )
+
+    @classmethod
+    def from_iso_batch(cls, isos: Any, random_vals: Any = None) -> Any:
+        """
+        Vectorised 'from_time' over a sequence of ISO 8601 strings (requires numpy).
+
+        Each string is validated and parsed as in 'from_iso_string' (sharing its
+        memoized parser), then node/sequence entropy and mixing are applied to
+        the whole batch as in 'from_time_batch'. numpy's own datetime64 parser
+        is not used: it rejects the 'Z'/offset suffixes these strings carry.
+
+        Returns:
+            A numpy.ndarray of dtype uint64 holding the raw ID values.
+        """
+        np = _require_numpy()
+        ts_compute = cls._ts_compute
+        ts = np.empty(len(isos), dtype=np.int64)
+        for i, iso in enumerate(isos):
+            if iso is None:
+                raise ChronoError("Input string is null")
+            if not isinstance(iso, str) or _ISO_RE.match(iso) is None:
+                raise ChronoError("Invalid ISO 8601 format")
+            ts[i] = ts_compute(_parse_iso(iso))
+        # Buckets floor towards -inf: negative exactly when a date < epoch.
+        if len(ts) and ts.min() < 0:
+            raise ChronoError("Timestamp underflow: Date is before Epoch (2020-01-01)")
+
+        head = ts.astype(np.uint64)
+        head &= np.uint64(cls.T_MASK)
+        head <<= np.uint64(cls.T_SHIFT)
+        return cls._mix_batch(head, len(ts), random_vals)
+
+    @classmethod
+    def _mix_batch(cls, head: Any, n: int, random_vals: Any) -> Any:
+        """
+        Mixes 'n' node/sequence values with the thread's persona and ORs in
+        'head' (the shifted time segment: a uint64 scalar or per-ID array).
+        """
+        np = _require_numpy()
+        if random_vals is None:
+            # Draw only as many bytes per ID as the node+sequence bits need.
+            narrow = cls.N_BITS + cls.S_BITS <= 32
+            raw_dtype = np.uint32 if narrow else np.uint64
+            raw = os.urandom(n * (4 if narrow else 8))
+            # astype copies into a writable uint64 buffer reused as the output.
+            out = np.frombuffer(raw, dtype=raw_dtype).astype(np.uint64)
+        else:
+            # np.array copies, so the caller's array is never mixed in place.
+            out = np.array(random_vals, dtype=np.uint64)
+            if out.shape != (n,):
+                raise ChronoError(
+                    f"Expected {n} random values, got {out.size} "
+                    f"(shape {out.shape})"
+                )
+
+        persona = _get_thread_state(cls).persona
+        n_mask = np.uint64(cls.N_MASK)
+        s_mask = np.uint64(cls.S_MASK)
+        s_bits = np.uint64(cls.S_BITS)
+
+        # One temporary (the node segment); everything else is in place.
+        mix_n = out >> s_bits
+        mix_n &= n_mask
+        mix_n *= np.uint64(cls.N_MULT[persona.node_idx])
+        mix_n ^= np.uint64(persona.node_salt)
+        mix_n &= n_mask
+        mix_n <<= s_bits
+        mix_n |= head
+
+        out &= s_mask
+        out += np.uint64(persona.seq_offset)
+        out &= s_mask
+        out *= np.uint64(cls.S_MULT[persona.seq_idx])
+        out ^= np.uint64(persona.seq_salt)
+        out &= s_mask
+        out |= mix_n
+        return out
+
+    @classmethod
+    def from_array(cls: Type[T], ids: Any) -> List[T]:
+        """
+        Wraps a batch of raw IDs (e.g. from 'generate_many()') as variant objects.
+
+        Batch APIs return numpy uint64 arrays so storage and export paths work
+        on the packed buffer; use this only when per-ID objects are needed.
+        """
+        values = ids.tolist() if hasattr(ids, "tolist") else ids
+        new = int.__new__
+        return [new(cls, v) for v in values]
+
+    @classmethod
+    def generate_stream(cls) -> Iterator[int]:
+        """
+        Yields an endless stream of raw IDs for the current time.
+
+        Uses the same thread-local state as 'generate()': within a time unit
+        the sequence steps, so IDs of one sequence run never repeat. When the
+        run wraps, the persona is re-rolled (Mode A) rather than waiting for
+        the next unit, so uniqueness past that point is probabilistic, exactly
+        as for 'generate()'. Class constants are bound once up front, and each
+        ID costs a single 'time.time_ns()' read. Consume the stream on the
+        thread that created it.
+        """
+        if not cls.UNIT_NS:
+            # Calendar precisions need the datetime path for bucketing.
+            while True:
+                yield cls.generate_int()
+
+        state = _get_thread_state(cls)
+        clock = time.time_ns
+        pack = cls._pack_persona
+        unit_ns = cls.UNIT_NS
+        s_bits = cls.S_BITS
+        s_mask = cls.S_MASK
+        while True:
+            ns = clock()
+            ts = (ns - EPOCH_2020_NS) // unit_ns
+            persona = state.persona
+            if ts > state.last_ts:
+                state.last_ts = ts
+                state.sequence = 0
+            elif ts == state.last_ts:
+                state.sequence = (state.sequence + 1) & s_mask
+                if state.sequence == 0:
+                    persona.rotate(s_bits)
+            else:
+                # Rollback
+                persona.rotate(s_bits)
+                state.sequence = (state.sequence + 1) & s_mask
+
+            if ns / 1e9 - persona.last_rotate > 60:
+                persona.rotate(s_bits)
+
+            yield pack(ts, persona.node_id, state.sequence, persona)
 
     @classmethod
     def from_persona(
@@ -557,20 +1291,41 @@ class ChronoBase(int):
         if dt is None:
             raise ChronoError("Input date is null")
         dt = _ensure_utc(dt)
-        if dt.timestamp() < EPOCH_2020:
+        if ts is None:
+            ts = cls._ts_compute(dt)
+            # Buckets floor towards -inf: negative exactly when dt < epoch.
+            if ts < 0:
+                raise ChronoError(
+                    "Timestamp underflow: Date is before Epoch (2020-01-01)"
+                )
+        elif dt.timestamp() < EPOCH_2020:
             raise ChronoError("Timestamp underflow: Date is before Epoch (2020-01-01)")
-        ts_val = (ts if ts is not None else TS_COMPUTE[cls.PRECISION](dt)) & cls.T_MASK
+        return int.__new__(cls, cls._pack_persona(ts, node_id, seq, persona))
 
-        # Hot Path: Inlined Weyl-Golden Mixing
-        # Multipliers ensure that the entropy space is covered uniformly (self-healing).
-        mix_n = (
-            (node_id * cls.N_MULT[persona.node_idx]) ^ persona.node_salt
-        ) & cls.N_MASK
-        s_val = (seq + persona.seq_offset) & cls.S_MASK
-        mix_s = ((s_val * cls.S_MULT[persona.seq_idx]) ^ persona.seq_salt) & cls.S_MASK
+    @classmethod
+    def _pack_persona(
+        cls, ts_val: int, node_id: int, seq: int, persona: Persona
+    ) -> int:
+        """
+        Packs an already-bucketed timestamp with the persona's mixed segments
+        into a raw 'int'.
 
-        val = (ts_val << cls.T_SHIFT) | (mix_n << cls.S_BITS) | mix_s
-        return super().__new__(cls, val)
+        Performs no validation; callers are responsible for the epoch check.
+        Generic version: every variant swaps in a compiled specialization.
+        """
+        # Hot Path: Weyl-Golden Mixing (native when '_speedups' is available)
+        # Multipliers ensure that the entropy space is covered uniformly (self-healing).
+        return _PACK(
+            ts_val,
+            node_id,
+            seq,
+            cls.N_MULT[persona.node_idx],
+            persona.node_salt,
+            cls.S_MULT[persona.seq_idx],
+            persona.seq_salt,
+            persona.seq_offset,
+            *cls.LAYOUT,
+        )
 
     @classmethod
     def from_parts(
@@ -592,19 +1347,29 @@ class ChronoBase(int):
         """
         if dt is None:
             raise ChronoError("Input date is null")
-        if dt.timestamp() < EPOCH_2020:
-            raise ChronoError("Timestamp underflow: Date is before Epoch (2020-01-01)")
-
         if persona:
+            # 'from_persona' normalises and epoch-checks 'dt' itself.
             return cls.from_persona(dt, node_id, seq, persona, ts=ts)
 
-        ts_val = (ts if ts is not None else TS_COMPUTE[cls.PRECISION](dt)) & cls.T_MASK
-
-        mix_n = ((node_id * cls.N_MULT[p_idx % 128]) ^ salt) & cls.N_MASK
-        mix_s = ((seq * cls.S_MULT[p_idx % 128]) ^ salt) & cls.S_MASK
+        dt = _ensure_utc(dt)
+        if dt.timestamp() < EPOCH_2020:
+            raise ChronoError("Timestamp underflow: Date is before Epoch (2020-01-01)")
 
-        val = (ts_val << cls.T_SHIFT) | (mix_n << cls.S_BITS) | mix_s
-        return super().__new__(cls, val)
+        ts_val = ts if ts is not None else cls._ts_compute(dt)
+
+        idx = p_idx % 128
+        val = _PACK(
+            ts_val,
+            node_id,
+            seq,
+            cls.N_MULT[idx],
+            salt,
+            cls.S_MULT[idx],
+            salt,
+            0,
+            *cls.LAYOUT,
+        )
+        return int.__new__(cls, val)
 
     @classmethod
     def from_time(cls: Type[T], dt: datetime, random_val: Optional[int] = None) -> T:
@@ -616,14 +1381,9 @@ class ChronoBase(int):
             random_val: Combined node_id and sequence entropy.
         """
         if random_val is not None:
-            mask_s = (1 << cls.S_BITS) - 1
-            node_id = (
-                (random_val >> cls.S_BITS) & ((1 << cls.N_BITS) - 1)
-                if cls.N_BITS > 0
-                else 0
-            )
-            seq = random_val & mask_s
-            return cls.generate(dt=dt, node_id=node_id, seq=seq)
+            # No pre-masking: assembly masks each segment after mixing, and the
+            # low bits of the mix depend only on the low bits of the input.
+            return cls.generate(dt=dt, node_id=random_val >> cls.S_BITS, seq=random_val)
         return cls.generate(dt=dt)
 
     @classmethod
@@ -631,27 +1391,93 @@ class ChronoBase(int):
         """Parses an ISO 8601 string and generates an ID."""
         if iso is None:
             raise ChronoError("Input string is null")
-        try:
-            iso_clean = iso.replace("Z", "+00:00")
-            dt = datetime.fromisoformat(iso_clean)
-        except (ValueError, TypeError):
+        if not isinstance(iso, str) or _ISO_RE.match(iso) is None:
             raise ChronoError("Invalid ISO 8601 format")
-        return cls.generate(dt=dt)
+        return cls.generate(dt=_parse_iso(iso))
+
+    @classmethod
+    def time_of(cls, value: int) -> datetime:
+        """
+        Decodes the timestamp of a raw ID value (e.g. a BIGINT column).
+
+        Same result as 'cls(value).get_time()' without boxing the value.
+        """
+        ts_val = value >> cls.T_SHIFT
+        unit_ns = cls.UNIT_NS
+        if 0 < unit_ns < 1_000_000_000:
+            # Sub-second buckets rarely repeat across IDs, so the memo would
+            # mostly miss: decode directly (exact integer microseconds).
+            return EPOCH_2020_DT + timedelta(microseconds=(ts_val * unit_ns) // 1000)
+        return _bucket_time(cls.PRECISION, ts_val)
+
+    @classmethod
+    def unix_us_of(cls, value: int) -> int:
+        """
+        Decodes the timestamp of a raw ID value as integer Unix microseconds.
+
+        Same result as 'cls(value).get_unix_us()' without boxing the value.
+        """
+        ts_val = value >> cls.T_SHIFT
+        if cls.UNIT_NS:
+            return EPOCH_2020 * 1_000_000 + (ts_val * cls.UNIT_NS) // 1000
+        return int(cls._ts_reverse(ts_val)) * 1_000_000
 
     def get_time(self) -> datetime:
         """Decodes the embedded timestamp from the ID."""
-        ts_val = int(self) >> self.T_SHIFT
-        unix_ts = TS_REVERSE[self.PRECISION](ts_val)
-        return datetime.fromtimestamp(unix_ts, tz=timezone.utc)
+        return self.time_of(self)
+
+    def get_unix_us(self) -> int:
+        """
+        Decodes the embedded timestamp as integer Unix microseconds.
+
+        Skips the datetime construction of 'get_time()' for callers that only
+        compare, sort, or store the instant.
+        """
+        return self.unix_us_of(self)
+
+    @classmethod
+    def get_times_batch(cls, ids: Any) -> Any:
+        """
+        Decodes an array of raw IDs in one vectorised pass (requires numpy).
+
+        Returns:
+            A numpy.ndarray of dtype datetime64[us] (UTC).
+        """
+        np = _require_numpy()
+        ids = np.asarray(ids, dtype=np.uint64)
+        if cls.UNIT_NS:
+            unit_us = cls.UNIT_NS // 1000
+            base_us = EPOCH_2020 * 1_000_000
+            kernel = _numba_decode_kernel()
+            if kernel is not None:
+                # One fused pass over the array, split across cores.
+                us = np.empty(ids.size, dtype=np.int64)
+                kernel(ids.ravel(), np.uint64(cls.T_SHIFT), unit_us, base_us, us)
+                return us.reshape(ids.shape).view("datetime64[us]")
+            us = (ids >> np.uint64(cls.T_SHIFT)).astype(np.int64)
+            us *= unit_us
+            us += base_us
+            return us.view("datetime64[us]")
+        ts = ids >> np.uint64(cls.T_SHIFT)
+        months = ts.astype(np.int64) * cls.UNIT_MONTHS
+        return (np.datetime64(f"{EPOCH_YEAR}-01", "M") + months).astype(
+            "datetime64[us]"
+        )
 
     def to_iso_string(self) -> str:
         """Converts the ID's embedded time to an ISO 8601 string."""
-        dt = self.get_time()
-        base = dt.strftime("%Y-%m-%dT%H:%M:%S")
+        # Formatted from integer fields; no datetime or strftime involved.
+        secs, us = divmod(self.get_unix_us(), 1_000_000)
+        days, secs = divmod(secs, 86400)
+        y, m, d = _civil_from_days(days)
+        base = (
+            f"{y:04d}-{m:02d}-{d:02d}"
+            f"T{secs // 3600:02d}:{secs // 60 % 60:02d}:{secs % 60:02d}"
+        )
         if self.PRECISION == Precision.MS:
-            return f"{base}.{dt.microsecond // 1000:03d}Z"
+            return f"{base}.{us // 1000:03d}Z"
         if self.PRECISION == Precision.US:
-            return f"{base}.{dt.microsecond:06d}Z"
+            return f"{base}.{us:06d}Z"
         return f"{base}Z"
 
     def formatted(self) -> str:
@@ -660,18 +1486,50 @@ class ChronoBase(int):
         32-bit tier: XXXX-XXXX (9 chars)
         64-bit tier: XXXX-XXXX-XXXX-XXXX (19 chars)
         """
-        # Tiered padding strategy: 32-bit family vs 64-bit family.
-        width = self.T_BITS + self.N_BITS + self.S_BITS
-        if self.SIGNED:
-            width += 1
+        # Tiered padding: 16 hex digits (4 chunks) for the 64-bit family,
+        # 8 digits (2 chunks) for the 32-bit family. to_bytes().hex() yields
+        # the zero-padded digits without going through the format mini-language.
+        width = self.BYTE_WIDTH
+        try:
+            h = self.to_bytes(width, "big").hex().upper()
+        except OverflowError:
+            # Negative or wider than the tier (the constructor accepts any
+            # int): fall back to the padded format, chunked the same way.
+            h = f"{int(self):0{width * 2}X}"
+            return "-".join(h[i : i + 4] for i in range(0, len(h), 4))
+
+        # Fixed 4-character chunks separated by hyphens
+        if width == 8:
+            return f"{h[:4]}-{h[4:8]}-{h[8:12]}-{h[12:]}"
+        return f"{h[:4]}-{h[4:]}"
+
+    def to_bytes_le(self) -> bytes:
+        """Returns the little-endian wire encoding (4 or 8 bytes, per tier)."""
+        return self._pack_le(self)
 
-        # Use 16 hex digits (4 chunks) for 64-bit tier, 8 digits (2 chunks) for 32-bit.
-        hex_len = 16 if width > 32 else 8
-        h = f"{int(self):0{hex_len}X}"
+    @classmethod
+    def from_bytes_le(cls: Type[T], data: bytes) -> T:
+        """Decodes the little-endian wire encoding produced by 'to_bytes_le()'."""
+        if len(data) != cls.BYTE_WIDTH:
+            raise ChronoError(
+                f"Expected {cls.BYTE_WIDTH} bytes for {cls.__name__}, got {len(data)}"
+            )
+        return int.__new__(cls, int.from_bytes(data, "little"))
 
-        # Split into 4-character chunks separated by hyphens
-        parts = [h[i : i + 4] for i in range(0, len(h), 4)]
-        return "-".join(parts)
+    @classmethod
+    def to_bytes_le_batch(cls, ids: Any) -> bytes:
+        """
+        Encodes an array of raw IDs back to back in one copy (requires numpy).
+
+        Equivalent to joining 'to_bytes_le()' over the batch.
+        """
+        np = _require_numpy()
+        ids = np.asarray(ids, dtype=np.uint64)
+        if ids.size and int(ids.max()) >> (8 * cls.BYTE_WIDTH):
+            raise ChronoError(
+                f"ID out of range for {cls.BYTE_WIDTH}-byte {cls.__name__}"
+            )
+        return ids.astype(f"<u{cls.BYTE_WIDTH}", copy=False).tobytes()
 
     def __str__(self) -> str:
         return self.formatted()
@@ -686,6 +1544,8 @@ class ChronoBase(int):
 class UChrono64mo(ChronoBase):
     """Unsigned 64-bit Month ID. [T:12][N:26][S:26]. 341 years range."""
 
+    __slots__ = ()
+
     PRECISION = Precision.MO
     T_BITS, N_BITS, S_BITS = 12, 26, 26
     SIGNED = False
@@ -694,6 +1554,8 @@ class UChrono64mo(ChronoBase):
 class Chrono64mo(ChronoBase):
     """Signed 64-bit Month ID. [0][T:12][N:25][S:26]."""
 
+    __slots__ = ()
+
     PRECISION = Precision.MO
     T_BITS, N_BITS, S_BITS = 12, 25, 26
 
@@ -701,6 +1563,8 @@ class Chrono64mo(ChronoBase):
 class UChrono64w(ChronoBase):
     """Unsigned 64-bit Week ID. [T:14][N:26][S:24]. 315 years range."""
 
+    __slots__ = ()
+
     PRECISION = Precision.W
     T_BITS, N_BITS, S_BITS = 14, 26, 24
     SIGNED = False
@@ -709,6 +1573,8 @@ class UChrono64w(ChronoBase):
 class Chrono64w(ChronoBase):
     """Signed 64-bit Week ID. [0][T:14][N:25][S:24]."""
 
+    __slots__ = ()
+
     PRECISION = Precision.W
     T_BITS, N_BITS, S_BITS = 14, 25, 24
 
@@ -716,6 +1582,8 @@ class Chrono64w(ChronoBase):
 class UChrono64d(ChronoBase):
     """Unsigned 64-bit Day ID. [T:17][N:24][S:23]. 358 years range."""
 
+    __slots__ = ()
+
     PRECISION = Precision.D
     T_BITS, N_BITS, S_BITS = 17, 24, 23
     SIGNED = False
@@ -724,6 +1592,8 @@ class UChrono64d(ChronoBase):
 class Chrono64d(ChronoBase):
     """Signed 64-bit Day ID. [0][T:17][N:23][S:23]."""
 
+    __slots__ = ()
+
     PRECISION = Precision.D
     T_BITS, N_BITS, S_BITS = 17, 23, 23
 
@@ -731,6 +1601,8 @@ class Chrono64d(ChronoBase):
 class UChrono64h(ChronoBase):
     """Unsigned 64-bit Hour ID. [T:21][N:22][S:21]. 239 years range."""
 
+    __slots__ = ()
+
     PRECISION = Precision.H
     T_BITS, N_BITS, S_BITS = 21, 22, 21
     SIGNED = False
@@ -739,6 +1611,8 @@ class UChrono64h(ChronoBase):
 class Chrono64h(ChronoBase):
     """Signed 64-bit Hour ID. [0][T:21][N:21][S:21]."""
 
+    __slots__ = ()
+
     PRECISION = Precision.H
     T_BITS, N_BITS, S_BITS = 21, 21, 21
 
@@ -746,6 +1620,8 @@ class Chrono64h(ChronoBase):
 class UChrono64m(ChronoBase):
     """Unsigned 64-bit Minute ID. [T:27][N:19][S:18]. 255 years range."""
 
+    __slots__ = ()
+
     PRECISION = Precision.M
     T_BITS, N_BITS, S_BITS = 27, 19, 18
     SIGNED = False
@@ -754,6 +1630,8 @@ class UChrono64m(ChronoBase):
 class Chrono64m(ChronoBase):
     """Signed 64-bit Minute ID. [0][T:27][N:18][S:18]."""
 
+    __slots__ = ()
+
     PRECISION = Precision.M
     T_BITS, N_BITS, S_BITS = 27, 18, 18
 
@@ -761,6 +1639,8 @@ class Chrono64m(ChronoBase):
 class UChrono64s(ChronoBase):
     """Unsigned 64-bit Second ID. [T:33][N:16][S:15]. 272 years range."""
 
+    __slots__ = ()
+
     PRECISION = Precision.S
     T_BITS, N_BITS, S_BITS = 33, 16, 15
     SIGNED = False
@@ -769,6 +1649,8 @@ class UChrono64s(ChronoBase):
 class Chrono64s(ChronoBase):
     """Signed 64-bit Second ID. [0][T:33][N:15][S:15]."""
 
+    __slots__ = ()
+
     PRECISION = Precision.S
     T_BITS, N_BITS, S_BITS = 33, 15, 15
 
@@ -779,6 +1661,8 @@ class Chrono64s(ChronoBase):
 class UChrono64ds(ChronoBase):
     """Unsigned 64-bit Decisecond (100ms) ID. [T:36][N:15][S:13]. 217 years range."""
 
+    __slots__ = ()
+
     PRECISION = Precision.DS
     T_BITS, N_BITS, S_BITS = 36, 15, 13
     SIGNED = False
@@ -787,6 +1671,8 @@ class UChrono64ds(ChronoBase):
 class Chrono64ds(ChronoBase):
     """Signed 64-bit Decisecond ID. [0][T:36][N:14][S:13]."""
 
+    __slots__ = ()
+
     PRECISION = Precision.DS
     T_BITS, N_BITS, S_BITS = 36, 14, 13
 
@@ -794,6 +1680,8 @@ class Chrono64ds(ChronoBase):
 class UChrono64cs(ChronoBase):
     """Unsigned 64-bit Centisecond (10ms) ID. [T:40][N:12][S:12]. 348 years range."""
 
+    __slots__ = ()
+
     PRECISION = Precision.CS
     T_BITS, N_BITS, S_BITS = 40, 12, 12
     SIGNED = False
@@ -802,6 +1690,8 @@ class UChrono64cs(ChronoBase):
 class Chrono64cs(ChronoBase):
     """Signed 64-bit Centisecond ID. [0][T:40][N:11][S:12]."""
 
+    __slots__ = ()
+
     PRECISION = Precision.CS
     T_BITS, N_BITS, S_BITS = 40, 11, 12
 
@@ -809,6 +1699,8 @@ class Chrono64cs(ChronoBase):
 class UChrono64ms(ChronoBase):
     """Unsigned 64-bit Millisecond ID. [T:43][N:11][S:10]. 279 years range."""
 
+    __slots__ = ()
+
     PRECISION = Precision.MS
     T_BITS, N_BITS, S_BITS = 43, 11, 10
     SIGNED = False
@@ -817,6 +1709,8 @@ class UChrono64ms(ChronoBase):
 class Chrono64ms(ChronoBase):
     """Signed 64-bit Millisecond ID. [0][T:43][N:10][S:10]."""
 
+    __slots__ = ()
+
     PRECISION = Precision.MS
     T_BITS, N_BITS, S_BITS = 43, 10, 10
 
@@ -824,6 +1718,8 @@ class Chrono64ms(ChronoBase):
 class UChrono64us(ChronoBase):
     """Unsigned 64-bit Microsecond ID. [T:53][N:6][S:5]. 285 years range."""
 
+    __slots__ = ()
+
     PRECISION = Precision.US
     T_BITS, N_BITS, S_BITS = 53, 6, 5
     SIGNED = False
@@ -832,6 +1728,8 @@ class UChrono64us(ChronoBase):
 class Chrono64us(ChronoBase):
     """Signed 64-bit Microsecond ID. [0][T:53][N:5][S:5]."""
 
+    __slots__ = ()
+
     PRECISION = Precision.US
     T_BITS, N_BITS, S_BITS = 53, 5, 5
 
@@ -842,6 +1740,8 @@ class Chrono64us(ChronoBase):
 class UChrono32y(ChronoBase):
     """Unsigned 32-bit Year ID. [T:8][N:13][S:11]. 256 years range."""
 
+    __slots__ = ()
+
     PRECISION = Precision.Y
     T_BITS, N_BITS, S_BITS = 8, 13, 11
     SIGNED = False
@@ -850,6 +1750,8 @@ class UChrono32y(ChronoBase):
 class Chrono32y(ChronoBase):
     """Signed 32-bit Year ID. [0][T:8][N:12][S:11]."""
 
+    __slots__ = ()
+
     PRECISION = Precision.Y
     T_BITS, N_BITS, S_BITS = 8, 12, 11
 
@@ -857,6 +1759,8 @@ class Chrono32y(ChronoBase):
 class UChrono32hy(ChronoBase):
     """Unsigned 32-bit Half-Year ID. [T:9][N:12][S:11]. 256 years range."""
 
+    __slots__ = ()
+
     PRECISION = Precision.HY
     T_BITS, N_BITS, S_BITS = 9, 12, 11
     SIGNED = False
@@ -865,6 +1769,8 @@ class UChrono32hy(ChronoBase):
 class Chrono32hy(ChronoBase):
     """Signed 32-bit Half-Year ID. [0][T:9][N:11][S:11]."""
 
+    __slots__ = ()
+
     PRECISION = Precision.HY
     T_BITS, N_BITS, S_BITS = 9, 11, 11
 
@@ -872,6 +1778,8 @@ class Chrono32hy(ChronoBase):
 class UChrono32q(ChronoBase):
     """Unsigned 32-bit Quarter ID. [T:10][N:11][S:11]. 256 years range."""
 
+    __slots__ = ()
+
     PRECISION = Precision.Q
     T_BITS, N_BITS, S_BITS = 10, 11, 11
     SIGNED = False
@@ -880,6 +1788,8 @@ class UChrono32q(ChronoBase):
 class Chrono32q(ChronoBase):
     """Signed 32-bit Quarter ID. [0][T:10][N:10][S:11]."""
 
+    __slots__ = ()
+
     PRECISION = Precision.Q
     T_BITS, N_BITS, S_BITS = 10, 10, 11
 
@@ -887,6 +1797,8 @@ class Chrono32q(ChronoBase):
 class UChrono32mo(ChronoBase):
     """Unsigned 32-bit Month ID. [T:12][N:10][S:10]. 341 years range."""
 
+    __slots__ = ()
+
     PRECISION = Precision.MO
     T_BITS, N_BITS, S_BITS = 12, 10, 10
     SIGNED = False
@@ -895,6 +1807,8 @@ class UChrono32mo(ChronoBase):
 class Chrono32mo(ChronoBase):
     """Signed 32-bit Month ID. [0][T:12][N:9][S:10]."""
 
+    __slots__ = ()
+
     PRECISION = Precision.MO
     T_BITS, N_BITS, S_BITS = 12, 9, 10
 
@@ -902,6 +1816,8 @@ class Chrono32mo(ChronoBase):
 class UChrono32w(ChronoBase):
     """Unsigned 32-bit Week ID. [T:14][N:9][S:9]. 315 years range."""
 
+    __slots__ = ()
+
     PRECISION = Precision.W
     T_BITS, N_BITS, S_BITS = 14, 9, 9
     SIGNED = False
@@ -910,6 +1826,8 @@ class UChrono32w(ChronoBase):
 class Chrono32w(ChronoBase):
     """Signed 32-bit Week ID. [0][T:14][N:8][S:9]."""
 
+    __slots__ = ()
+
     PRECISION = Precision.W
     T_BITS, N_BITS, S_BITS = 14, 8, 9
 
@@ -917,6 +1835,8 @@ class Chrono32w(ChronoBase):
 class UChrono32d(ChronoBase):
     """Unsigned 32-bit Day ID. [T:17][N:8][S:7]. 358 years range."""
 
+    __slots__ = ()
+
     PRECISION = Precision.D
     T_BITS, N_BITS, S_BITS = 17, 8, 7
     SIGNED = False
@@ -925,6 +1845,8 @@ class UChrono32d(ChronoBase):
 class Chrono32d(ChronoBase):
     """Signed 32-bit Day ID. [0][T:17][N:7][S:7]."""
 
+    __slots__ = ()
+
     PRECISION = Precision.D
     T_BITS, N_BITS, S_BITS = 17, 7, 7
 
@@ -935,6 +1857,8 @@ class Chrono32d(ChronoBase):
 class UChrono32h(ChronoBase):
     """Unsigned 32-bit Hour ID. [T:22][N:5][S:5]. 478 years range."""
 
+    __slots__ = ()
+
     PRECISION = Precision.H
     T_BITS, N_BITS, S_BITS = 22, 5, 5
     SIGNED = False
@@ -943,6 +1867,8 @@ class UChrono32h(ChronoBase):
 class Chrono32h(ChronoBase):
     """Signed 32-bit Hour ID. [0][T:22][N:4][S:5]."""
 
+    __slots__ = ()
+
     PRECISION = Precision.H
     T_BITS, N_BITS, S_BITS = 22, 4, 5
 
@@ -950,6 +1876,8 @@ class Chrono32h(ChronoBase):
 class UChrono32tm(ChronoBase):
     """Unsigned 32-bit Ten-Minute ID. [T:24][N:4][S:4]. 319 years range."""
 
+    __slots__ = ()
+
     PRECISION = Precision.TM
     T_BITS, N_BITS, S_BITS = 24, 4, 4
     SIGNED = False
@@ -958,6 +1886,8 @@ class UChrono32tm(ChronoBase):
 class Chrono32tm(ChronoBase):
     """Signed 32-bit Ten-Minute ID. [0][T:24][N:3][S:4]."""
 
+    __slots__ = ()
+
     PRECISION = Precision.TM
     T_BITS, N_BITS, S_BITS = 24, 3, 4
 
@@ -965,6 +1895,8 @@ class Chrono32tm(ChronoBase):
 class UChrono32m(ChronoBase):
     """Unsigned 32-bit Minute ID. [T:28][N:2][S:2]. 510 years range."""
 
+    __slots__ = ()
+
     PRECISION = Precision.M
     T_BITS, N_BITS, S_BITS = 28, 2, 2
     SIGNED = False
@@ -973,6 +1905,8 @@ class UChrono32m(ChronoBase):
 class Chrono32m(ChronoBase):
     """Signed 32-bit Minute ID. [0][T:28][N:1][S:2]."""
 
+    __slots__ = ()
+
     PRECISION = Precision.M
     T_BITS, N_BITS, S_BITS = 28, 1, 2
 
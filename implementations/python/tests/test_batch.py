@@ -0,0 +1,198 @@
+import sys
+import unittest
+from datetime import datetime, timezone
+from chrono_id import (
+    Chrono64s,
+    Chrono64ms,
+    UChrono32m,
+    ChronoBase,
+    ChronoError,
+    Generator,
+    Persona,
+)
+from chrono_id.core import _get_thread_state
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - optional dependency
+    np = None
+
+
+@unittest.skipIf(np is None, "numpy not installed")
+class TestBatchGeneration(unittest.TestCase):
+    def test_generate_many_matches_scalar(self):
+        dt = datetime(2030, 6, 1, 12, 0, 0, tzinfo=timezone.utc)
+        state = _get_thread_state(Chrono64s)
+        state.last_ts = 0
+        state.persona.last_rotate = dt.timestamp()
+        persona = state.persona
+
+        ids = Chrono64s.generate_many(5, dt=dt)
+        self.assertEqual(ids.dtype, np.uint64)
+        self.assertEqual(len(ids), 5)
+        self.assertEqual(state.sequence, 4)
+
+        expected = [
+            Chrono64s.from_persona(dt, persona.node_id, i, persona) for i in range(5)
+        ]
+        self.assertEqual([int(v) for v in ids], expected)
+
+    def test_generator_generate_many_matches_generate(self):
+        dt = datetime(2030, 6, 1, 12, 0, 0, tzinfo=timezone.utc)
+        gen = Generator(Chrono64s)
+        gen.persona.last_rotate = dt.timestamp()
+        twin = Generator(Chrono64s, persona=Persona(Chrono64s.S_BITS))
+        for field in Persona.__slots__:
+            setattr(twin.persona, field, getattr(gen.persona, field))
+
+        ids = gen.generate_many(5, dt=dt)
+        self.assertEqual(ids.dtype, np.uint64)
+        self.assertEqual([int(v) for v in ids], [twin.generate(dt) for _ in range(5)])
+        self.assertEqual((gen.last_ts, gen.sequence), (twin.last_ts, twin.sequence))
+
+    def test_generate_many_rotates_on_overflow(self):
+        dt = datetime(2030, 6, 1, 12, 0, 0, tzinfo=timezone.utc)
+        state = _get_thread_state(UChrono32m)
+        state.last_ts = 0
+        state.persona.last_rotate = dt.timestamp()
+
+        ids = UChrono32m.generate_many(10, dt=dt)
+        self.assertEqual(len(ids), 10)
+        # 2 sequence bits: the run wraps twice and ends on sequence 1.
+        self.assertEqual(state.sequence, 1)
+        ts_vals = {int(v) >> UChrono32m.T_SHIFT for v in ids}
+        self.assertEqual(len(ts_vals), 1)
+
+    def test_from_time_batch_matches_from_time(self):
+        dt = datetime(2030, 6, 1, 12, 0, 0, tzinfo=timezone.utc)
+        for cls in (Chrono64s, UChrono32m):
+            with self.subTest(cls=cls.__name__):
+                state = _get_thread_state(cls)
+                state.last_ts = 0
+                state.persona.last_rotate = dt.timestamp()
+                bits = cls.N_BITS + cls.S_BITS
+                vals = np.array([0, 1, (1 << bits) - 1, 0x5A5A5A5A], dtype=np.uint64)
+
+                ids = cls.from_time_batch(len(vals), dt=dt, random_vals=vals)
+                self.assertEqual(ids.dtype, np.uint64)
+                # Reset so from_time() sees the same persona state for each value.
+                expected = []
+                for v in vals:
+                    state.last_ts = 0
+                    expected.append(int(cls.from_time(dt, int(v))))
+                self.assertEqual([int(v) for v in ids], expected)
+
+        ids = Chrono64s.from_time_batch(1000, dt=dt)
+        self.assertEqual(len(ids), 1000)
+        self.assertEqual(
+            {int(v) >> Chrono64s.T_SHIFT for v in ids},
+            {int(Chrono64s.from_time(dt)) >> Chrono64s.T_SHIFT},
+        )
+
+    def test_from_iso_batch_matches_from_time(self):
+        from chrono_id.core import _parse_iso
+
+        isos = [
+            "2023-05-20T10:30:00.123Z",
+            "2023-05-20T10:30:00.123+05:30",
+            "2031-01-01",
+            "2024-02-29T23:59:59.999999Z",
+        ]
+        for cls in (Chrono64ms, UChrono32m):
+            with self.subTest(cls=cls.__name__):
+                state = _get_thread_state(cls)
+                persona = state.persona
+                vals = np.array([0, 1, 7, 0x5A5A5A], dtype=np.uint64)
+                ids = cls.from_iso_batch(isos, random_vals=vals)
+                self.assertEqual(ids.dtype, np.uint64)
+                # Keep from_time() on the same persona: no rollback or
+                # 60-second rotation between the (unordered) dates.
+                persona.last_rotate = float("inf")
+                expected = []
+                for iso, v in zip(isos, vals):
+                    state.last_ts = 0
+                    expected.append(int(cls.from_time(_parse_iso(iso), int(v))))
+                persona.last_rotate = datetime.now(timezone.utc).timestamp()
+                self.assertEqual([int(v) for v in ids], expected)
+
+        self.assertEqual(len(Chrono64ms.from_iso_batch(isos)), len(isos))
+        if sys.version_info >= (3, 11):
+            # Non-canonical shapes fall back to fromisoformat, as in from_iso_string.
+            ids = Chrono64ms.from_iso_batch(["20240101T000000Z", "2024-01-01T12Z"])
+            self.assertEqual(
+                [Chrono64ms(int(v)).to_iso_string() for v in ids],
+                ["2024-01-01T00:00:00.000Z", "2024-01-01T12:00:00.000Z"],
+            )
+        with self.assertRaisesRegex(ChronoError, "Invalid ISO 8601 format"):
+            Chrono64ms.from_iso_batch(["2023-05-20T10:30:00Z", "not-a-date"])
+        with self.assertRaisesRegex(ChronoError, "Date is before Epoch"):
+            Chrono64ms.from_iso_batch(["2019-12-31T23:59:59Z"])
+
+    def test_get_times_batch_matches_get_time(self):
+        dt = datetime(2031, 8, 17, 13, 45, 12, 345678, tzinfo=timezone.utc)
+        for cls in ChronoBase.__subclasses__():
+            with self.subTest(cls=cls.__name__):
+                ids = [int(cls.from_time(dt, r)) for r in (0, 1, 12345)]
+                decoded = cls.get_times_batch(np.array(ids, dtype=np.uint64))
+                self.assertEqual(decoded.dtype, np.dtype("datetime64[us]"))
+                expected = [
+                    np.datetime64(cls(v).get_time().replace(tzinfo=None), "us")
+                    for v in ids
+                ]
+                self.assertEqual(list(decoded), expected)
+                self.assertEqual(
+                    [cls(v).get_unix_us() for v in ids],
+                    list(decoded.astype(np.int64)),
+                )
+
+    def test_get_times_batch_numba_matches_numpy(self):
+        from chrono_id import core
+
+        if core._numba_decode_kernel() is None:
+            self.skipTest("numba not installed")
+        ids = Chrono64s.from_time_batch(1000)
+        fused = Chrono64s.get_times_batch(ids)
+        kernel = core._DECODE_KERNEL
+        try:
+            core._DECODE_KERNEL = False
+            self.assertTrue((fused == Chrono64s.get_times_batch(ids)).all())
+        finally:
+            core._DECODE_KERNEL = kernel
+
+    def test_to_bytes_le_batch(self):
+        for cls in (UChrono32m, Chrono64s):
+            with self.subTest(cls=cls.__name__):
+                ids = cls.from_time_batch(16)
+                expected = b"".join(cls(int(v)).to_bytes_le() for v in ids)
+                self.assertEqual(cls.to_bytes_le_batch(ids), expected)
+
+    def test_to_bytes_le_batch_rejects_oversized(self):
+        ids = np.array([1, 2**40], dtype=np.uint64)
+        with self.assertRaisesRegex(ChronoError, "out of range"):
+            UChrono32m.to_bytes_le_batch(ids)
+
+    def test_from_array(self):
+        ids = Chrono64s.generate_many(8)
+        objs = Chrono64s.from_array(ids)
+        self.assertEqual(len(objs), 8)
+        self.assertTrue(all(type(o) is Chrono64s for o in objs))
+        self.assertEqual(objs, [int(v) for v in ids])
+        self.assertEqual(Chrono64s.from_array([1, 2]), [1, 2])
+
+    def test_random_vals_length_must_match(self):
+        vals = np.array([1, 2], dtype=np.uint64)
+        with self.assertRaisesRegex(ChronoError, "Expected 5 random values, got 2"):
+            Chrono64s.from_time_batch(5, random_vals=vals)
+        with self.assertRaisesRegex(ChronoError, "Expected 1 random values, got 2"):
+            Chrono64s.from_iso_batch(["2023-05-20T10:30:00Z"], random_vals=vals)
+        self.assertEqual(len(Chrono64s.from_time_batch(2, random_vals=vals)), 2)
+
+    def test_generate_many_underflow(self):
+        with self.assertRaisesRegex(ChronoError, "Date is before Epoch"):
+            Chrono64s.generate_many(3, dt=datetime(2019, 1, 1, tzinfo=timezone.utc))
+        with self.assertRaisesRegex(ChronoError, "Date is before Epoch"):
+            Chrono64s.from_time_batch(3, dt=datetime(2019, 1, 1, tzinfo=timezone.utc))
+
+
+if __name__ == "__main__":
+    unittest.main()
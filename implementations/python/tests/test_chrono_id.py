@@ -1,3 +1,5 @@
+import sys
+import time
 import unittest
 from datetime import datetime, timezone
 from chrono_id import (
@@ -20,7 +22,9 @@ from chrono_id import (
     ChronoBase,
     EPOCH_2020,
     ChronoError,
+    Persona,
 )
+from chrono_id.core import _ensure_utc, _get_thread_state
 
 
 # Helper to get UTC datetime (Post-2020)
@@ -39,6 +43,42 @@ class TestChronoID(unittest.TestCase):
         obj2 = Chrono32d(12345)
         self.assertEqual(obj2, 12345)
 
+    def test_variants_registry(self):
+        from chrono_id import VARIANTS
+
+        self.assertEqual(len(VARIANTS), 38)
+        self.assertIs(VARIANTS["uchrono64ms"], UChrono64ms)
+        self.assertEqual(set(VARIANTS.values()), set(ChronoBase.__subclasses__()))
+
+    def test_decode_raw_values(self):
+        dt = utc_dt(2031, 8, 17, 13, 45, 12, 345678)
+        for cls in (Chrono32y, UChrono32m, Chrono64ms, UChrono64us):
+            with self.subTest(cls=cls.__name__):
+                obj = cls.from_time(dt)
+                raw = int(obj)
+                self.assertEqual(cls.time_of(raw), obj.get_time())
+                self.assertEqual(cls.unix_us_of(raw), obj.get_unix_us())
+
+        # Coarse buckets are memoized: IDs sharing one decode to one datetime.
+        a, b = UChrono32m.from_time(dt), UChrono32m.from_time(dt)
+        self.assertIs(a.get_time(), b.get_time())
+
+    def test_bytes_le_roundtrip(self):
+        for cls, width in ((Chrono32y, 4), (UChrono32m, 4), (Chrono64ms, 8)):
+            with self.subTest(cls=cls.__name__):
+                obj = cls()
+                data = obj.to_bytes_le()
+                self.assertEqual(data, int(obj).to_bytes(width, "little"))
+                self.assertEqual(cls.from_bytes_le(data), obj)
+                self.assertIsInstance(cls.from_bytes_le(data), cls)
+                with self.assertRaises(ChronoError):
+                    cls.from_bytes_le(data + b"\x00")
+
+    def test_no_instance_dict(self):
+        for cls in (Chrono32d, UChrono64us, Chrono64s):
+            with self.subTest(cls=cls.__name__):
+                self.assertFalse(hasattr(cls(1), "__dict__"))
+
     def test_from_time_and_get_time(self):
         # Use UTC post-2020
         dt = utc_dt(2023, 1, 1, 12, 30, 45)
@@ -61,16 +101,17 @@ class TestChronoID(unittest.TestCase):
             (Chrono32y, 31536000),  # Year precision
         ]
 
+        # Collect every out-of-precision variant, then assert once.
+        failed = []
         for cls, precision in variants:
-            with self.subTest(cls=cls.__name__):
-                obj = cls.from_parts(dt, node_id=0, seq=0, p_idx=0, salt=0)
-                decoded_dt = obj.get_time()
+            obj = cls.from_parts(dt, node_id=0, seq=0, p_idx=0, salt=0)
+            decoded_dt = obj.get_time()
 
-                # Check if decoded time is within precision limits
-                diff = abs((decoded_dt - dt).total_seconds())
-                self.assertLessEqual(
-                    diff, precision, f"{cls.__name__} failed precision check"
-                )
+            # Check if decoded time is within precision limits
+            diff = abs((decoded_dt - dt).total_seconds())
+            if diff > precision:
+                failed.append((cls.__name__, diff))
+        self.assertEqual(failed, [], "variants failed precision check")
 
     def test_time_flooring(self):
         dt = utc_dt(2023, 1, 1, 12, 30, 45)
@@ -92,6 +133,12 @@ class TestChronoID(unittest.TestCase):
         decoded = obj_d.get_time()
         self.assertEqual(decoded, utc_dt(2023, 1, 1, 0, 0, 0))
 
+    def test_far_future_microsecond_exact(self):
+        # Float unix timestamps round this value to ...176968; decode must not.
+        dt = utc_dt(2138, 2, 19, 13, 47, 50, 176967)
+        obj = UChrono64us.from_parts(dt, node_id=0, seq=0, p_idx=0, salt=0)
+        self.assertEqual(obj.get_time(), dt)
+
     def test_epoch_boundaries(self):
         # Epoch: Jan 1, 2020 UTC
         epoch = utc_dt(2020, 1, 1, 0, 0, 0)
@@ -117,6 +164,82 @@ class TestChronoID(unittest.TestCase):
         # With high probability they are different
         self.assertNotEqual(obj1, obj2)
 
+    def test_generate_now_fast_path(self):
+        # Fixed-width precisions divide time.time_ns() directly; calendar
+        # precisions count months from its civil date. Both decode to "now".
+        for cls, precision in ((Chrono64ms, 0.001), (UChrono32h, 3600), (Chrono32y, 0)):
+            with self.subTest(cls=cls.__name__):
+                before = datetime.now(timezone.utc)
+                obj = cls()
+                decoded = obj.get_time()
+                self.assertLessEqual(decoded, datetime.now(timezone.utc))
+                if precision:
+                    diff = (before - decoded).total_seconds()
+                    self.assertLessEqual(diff, precision)
+                else:
+                    self.assertEqual(decoded.year, before.year)
+
+        from chrono_id.core import TS_COMPUTE
+
+        calendar = [c for c in ChronoBase.__subclasses__() if c.UNIT_MONTHS]
+        self.assertEqual({c.PRECISION for c in calendar}, {0, 1, 2, 3})
+        for cls in calendar:
+            with self.subTest(cls=cls.__name__):
+                before = TS_COMPUTE[cls.PRECISION](datetime.now(timezone.utc))
+                ts = cls.generate_int() >> cls.T_SHIFT
+                after = TS_COMPUTE[cls.PRECISION](datetime.now(timezone.utc))
+                self.assertIn(ts, (before, after))
+
+    def test_generate_int_returns_plain_int(self):
+        dt = datetime(2030, 6, 1, 12, 0, 0, tzinfo=timezone.utc)
+        persona = Persona(UChrono64ms.S_BITS)
+        raw = UChrono64ms.generate_int(dt, seq=7, persona=persona)
+        self.assertIs(type(raw), int)
+        self.assertEqual(raw, UChrono64ms.from_persona(dt, persona.node_id, 7, persona))
+        self.assertIs(type(UChrono64ms.generate_int()), int)
+        with self.assertRaises(ChronoError):
+            UChrono64ms.generate_int(datetime(2019, 1, 1, tzinfo=timezone.utc))
+
+    def test_generate_stream(self):
+        from itertools import islice
+
+        for cls in (UChrono64ms, UChrono32m, Chrono32y):
+            with self.subTest(cls=cls.__name__):
+                ids = list(islice(cls.generate_stream(), 2000))
+                self.assertTrue(all(type(v) is int for v in ids))
+                stamps = [v >> cls.T_SHIFT for v in ids]
+                self.assertEqual(stamps, sorted(stamps))
+
+    def test_generate_stream_sequence_wrap(self):
+        from itertools import islice
+        from unittest import mock
+
+        # Pin the clock inside one millisecond and run past a full sequence.
+        cls = UChrono64ms
+        now_ns = time.time_ns()
+        state = _get_thread_state(cls)
+        state.last_ts = 0
+        persona = state.persona
+        persona.last_rotate = now_ns / 1e9
+        run = cls.S_MASK + 1
+        with mock.patch.object(time, "time_ns", return_value=now_ns):
+            stream = cls.generate_stream()
+            ids = list(islice(stream, run))
+            salts = (persona.node_salt, persona.seq_salt)
+            after_wrap = next(stream)
+
+        # One full run: every sequence value once, all IDs distinct.
+        self.assertEqual(len(set(ids)), run)
+        self.assertEqual(
+            {v >> cls.T_SHIFT for v in ids + [after_wrap]}, {state.last_ts}
+        )
+        # The wrap re-rolls the persona and restarts the sequence in the same unit.
+        self.assertEqual(state.sequence, 0)
+        self.assertNotEqual((persona.node_salt, persona.seq_salt), salts)
+        self.assertEqual(
+            after_wrap, cls._pack_persona(state.last_ts, persona.node_id, 0, persona)
+        )
+
     def test_precision_mismatch(self):
         with self.assertRaises(ChronoError):
             Chrono64s.from_iso_string("2019-12-31T23:59:59Z")
@@ -145,6 +268,19 @@ class TestChronoID(unittest.TestCase):
         id64_mixed = Chrono64s("1234 5678 90ab cdef")
         self.assertEqual(id64, id64_mixed)
 
+        # Unseparated strings: hex only when a hex letter is present
+        self.assertEqual(Chrono64s("1234567890ABCDEF"), id64)
+        self.assertEqual(int(Chrono64s("1311768467294899695")), 1311768467294899695)
+        self.assertEqual(int(Chrono64s("+42")), 42)
+        with self.assertRaisesRegex(ChronoError, "Invalid hex format"):
+            Chrono64s("12z4-0000")
+
+    def test_formatted_out_of_tier_values(self):
+        # The constructor accepts any int; values that don't fit the tier
+        # still render as they always did instead of raising.
+        self.assertEqual(str(Chrono64s(-1)), "-000-0000-0000-0001")
+        self.assertEqual(repr(UChrono32y(2**40)), "UChrono32y(1000-0000-000)")
+
     def test_from_formatted(self):
         # 64-bit explicit
         id64 = Chrono64s.from_formatted("1234-5678-90AB-CDEF")
@@ -171,14 +307,250 @@ class TestChronoID(unittest.TestCase):
             with self.assertRaisesRegex(ChronoError, "Invalid ISO 8601 format"):
                 Chrono64ms.from_iso_string("not-a-date")
 
+        with self.subTest(case="general-shapes"):
+            for iso in ("2023-05-20 10:30:00+05:30", "2023-05-20T10:30Z", "2023-05-20"):
+                expected = datetime.fromisoformat(iso.replace("Z", "+00:00"))
+                obj = Chrono64s.from_iso_string(iso)
+                self.assertEqual(obj.get_time(), _ensure_utc(expected))
+
+        with self.subTest(case="general-fallback"):
+            # Shapes outside the fast path still go through fromisoformat
+            # (which accepts these basic/comma forms from Python 3.11).
+            if sys.version_info < (3, 11):
+                self.skipTest("fromisoformat accepts these forms from 3.11")
+            for iso, expected in (
+                ("2024-01-01T00:00:00+0000", "2024-01-01T00:00:00.000Z"),
+                ("20240101T000000Z", "2024-01-01T00:00:00.000Z"),
+                ("2024-01-01T00:00:00,5Z", "2024-01-01T00:00:00.500Z"),
+                ("2024-01-01T12Z", "2024-01-01T12:00:00.000Z"),
+                ("2024-W01-2", "2024-01-02T00:00:00.000Z"),
+            ):
+                obj = Chrono64ms.from_iso_string(iso)
+                self.assertEqual(obj.to_iso_string(), expected)
+
+        with self.subTest(case="rejected"):
+            for iso in (
+                "2023-05-20T10:30:00ZZ",
+                "2023-05-20x",
+                "２０２３-05-20",
+                " 2023-05-20",
+                "",
+                20230520,
+            ):
+                with self.assertRaisesRegex(ChronoError, "Invalid ISO 8601 format"):
+                    Chrono64ms.from_iso_string(iso)
+
         with self.subTest(case="underflow"):
             with self.assertRaisesRegex(ChronoError, "Date is before Epoch"):
                 Chrono64s.from_iso_string("2010-01-01T00:00:00Z")
 
+        with self.subTest(case="memoized-parse"):
+            # The parse is cached; generation is not (sequence still advances).
+            iso = "2023-05-20T10:30:00.123+05:30"
+            first = Chrono64ms.from_iso_string(iso)
+            second = Chrono64ms.from_iso_string(iso)
+            self.assertNotEqual(first, second)
+            self.assertEqual(first.get_time(), second.get_time())
+
+    def test_fast_iso_parser(self):
+        from chrono_id.core import _fast_parse_iso
+
+        for iso in (
+            "2023-05-20T10:30:00Z",
+            "2023-05-20T10:30:00.123Z",
+            "2023-05-20T10:30:00.123456Z",
+            "2024-02-29T23:59:59.999999Z",
+        ):
+            with self.subTest(iso=iso):
+                expected = datetime.fromisoformat(iso.replace("Z", "+00:00"))
+                self.assertEqual(_fast_parse_iso(iso), expected)
+
+        # Other shapes and out-of-range fields defer to the general parser.
+        for iso in (
+            "2023-05-20T10:30:00+00:00",
+            "2023-05-20 10:30:00Z",
+            "2023-13-20T10:30:00Z",
+            "2023-05-20T10:30:0a.123Z",
+            "not-a-date",
+        ):
+            with self.subTest(iso=iso):
+                self.assertIsNone(_fast_parse_iso(iso))
+
+    def test_ts_compute_integer_exact(self):
+        from datetime import timedelta
+        from chrono_id.core import TS_COMPUTE, UNIT_NS, EPOCH_2020_DT, Precision
+
+        ist = timezone(timedelta(hours=5, minutes=30))
+        for dt in (
+            datetime(2020, 1, 1, tzinfo=timezone.utc),
+            datetime(2291, 12, 31, 23, 59, 59, 999999, tzinfo=timezone.utc),
+            datetime(2031, 1, 1, 3, 0, 0, 999999, tzinfo=ist),
+        ):
+            for precision, unit_ns in enumerate(UNIT_NS):
+                if not unit_ns:
+                    continue
+                with self.subTest(dt=dt, precision=precision):
+                    unit = timedelta(microseconds=unit_ns // 1000)
+                    expected = (dt - EPOCH_2020_DT) // unit
+                    self.assertEqual(TS_COMPUTE[precision](dt), expected)
+
+        # Naive datetimes are taken as UTC, for every precision.
+        naive = datetime(2024, 1, 1, 5, 6, 7, 891234)
+        self.assertEqual(TS_COMPUTE[Precision.D](datetime(2024, 1, 1)), 1461)
+        self.assertEqual(
+            [ts(naive) for ts in TS_COMPUTE],
+            [ts(naive.replace(tzinfo=timezone.utc)) for ts in TS_COMPUTE],
+        )
+
+    def test_ensure_utc(self):
+        from datetime import timedelta
+
+        utc = datetime(2023, 5, 20, 10, 30, tzinfo=timezone.utc)
+        self.assertIs(_ensure_utc(utc), utc)
+        self.assertEqual(_ensure_utc(utc.replace(tzinfo=None)), utc)
+        ist = timezone(timedelta(hours=5, minutes=30))
+        converted = _ensure_utc(utc.astimezone(ist))
+        self.assertEqual(converted, utc)
+        self.assertIs(converted.tzinfo, timezone.utc)
+
+    def test_civil_from_days(self):
+        from datetime import date
+        from chrono_id.core import _civil_from_days, _days_from_civil
+
+        unix_ordinal = date(1970, 1, 1).toordinal()
+        for days in list(range(18200, 20000)) + [0, 59, 60, 11016, 47541, 120000]:
+            with self.subTest(days=days):
+                d = date.fromordinal(unix_ordinal + days)
+                self.assertEqual(_civil_from_days(days), (d.year, d.month, d.day))
+                self.assertEqual(_days_from_civil(d.year, d.month, d.day), days)
+
     def test_from_time_null(self):
         with self.assertRaisesRegex(ChronoError, "Input date is null"):
             Chrono32d.from_parts(None, 0, 0, persona=None, p_idx=0, salt=0)
 
+    def test_buffered_randbits(self):
+        from chrono_id import core
+
+        for bits in (0, 1, 5, 15, 64, 128):
+            with self.subTest(bits=bits):
+                values = [core._randbits(bits) for _ in range(64)]
+                self.assertTrue(all(0 <= v < (1 << bits) for v in values))
+                if bits >= 15:
+                    self.assertGreater(len(set(values)), 60)
+
+        # Bits are consumed exactly; the byte block refills only when exhausted.
+        pool = core._BitPool()
+        pool.take(10)
+        self.assertEqual((pool.bits, pool.pos), (54, 8))
+        pool.take(128)
+        self.assertEqual((pool.bits, pool.pos), (54, 24))
+        pool.pos = core._ENTROPY_BLOCK - 4
+        self.assertLess(pool.take(64), 1 << 64)
+        self.assertEqual((pool.bits, pool.pos), (54, 8))
+
+    def test_compiled_pack_persona(self):
+        from chrono_id import core
+
+        persona = Persona(10)
+        native = core._pack_native
+        try:
+            for backend in ("active", "python"):
+                if backend == "python":
+                    core._pack_native = None
+                for cls in (Chrono32y, UChrono32m, Chrono64s, UChrono64us):
+                    with self.subTest(backend=backend, cls=cls.__name__):
+                        packer = core._compile_pack_persona(cls)
+                        for ts, node, seq in (
+                            (0, 0, 0),
+                            (12345, 77, 3),
+                            (1 << 60, 1 << 40, 1 << 30),
+                        ):
+                            expected = core._pack(
+                                ts,
+                                node,
+                                seq,
+                                cls.N_MULT[persona.node_idx],
+                                persona.node_salt,
+                                cls.S_MULT[persona.seq_idx],
+                                persona.seq_salt,
+                                persona.seq_offset,
+                                *cls.LAYOUT,
+                            )
+                            self.assertEqual(packer(ts, node, seq, persona), expected)
+        finally:
+            core._pack_native = native
+
+    def test_weyl_mix_segments(self):
+        from chrono_id.core import WeylMixer, weyl_mix
+
+        persona = Persona(Chrono64s.S_BITS)
+        node, seq = 0x2AB, 9
+        val = Chrono64s.from_persona(
+            datetime(2024, 1, 1, tzinfo=timezone.utc), node, seq, persona
+        )
+        mix_n = weyl_mix(
+            node,
+            Chrono64s.N_MASK,
+            Chrono64s.N_MULT[persona.node_idx],
+            persona.node_salt,
+        )
+        mix_s = weyl_mix(
+            (seq + persona.seq_offset) & Chrono64s.S_MASK,
+            Chrono64s.S_MASK,
+            Chrono64s.S_MULT[persona.seq_idx],
+            persona.seq_salt,
+        )
+        self.assertEqual((val >> Chrono64s.S_BITS) & Chrono64s.N_MASK, mix_n)
+        self.assertEqual(val & Chrono64s.S_MASK, mix_s)
+        self.assertIsInstance(WeylMixer, type)
+        self.assertIs(WeylMixer.mix, weyl_mix)
+        self.assertIs(WeylMixer().mix, weyl_mix)
+
+    def test_native_pack_parity(self):
+        from chrono_id import core
+
+        if core._pack_native is None:
+            self.skipTest("_speedups extension not built")
+        cases = [
+            (
+                123456789,
+                0x123,
+                456,
+                0x9E3779B97F4A7C55,
+                0x456,
+                0x084160217307455F,
+                0x321,
+                0x789,
+            ),
+            (2**40, 2**70 + 5, -3, 3, 0xFFFF, 5, 0xFFFF, 2**20),
+        ]
+        for cls in (Chrono64s, UChrono64us, Chrono32m):
+            for args in cases:
+                with self.subTest(cls=cls.__name__, args=args):
+                    layout = (
+                        cls.T_MASK,
+                        cls.N_MASK,
+                        cls.S_MASK,
+                        cls.T_SHIFT,
+                        cls.S_BITS,
+                    )
+                    self.assertEqual(
+                        core._pack_native(*args, *layout), core._pack(*args, *layout)
+                    )
+
+    def test_native_pack_rejects_bad_shifts(self):
+        from chrono_id import core
+
+        if core._pack_native is None:
+            self.skipTest("_speedups extension not built")
+        args = (1,) * 11
+        for shifts in ((64, 0), (0, -1), (2**70, 0)):
+            with self.subTest(shifts=shifts):
+                with self.assertRaises((ValueError, OverflowError)):
+                    core._pack_native(*args, *shifts)
+        with self.assertRaises(TypeError):
+            core._pack_native(*args, "1", 0)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -1,6 +1,6 @@
 import unittest
 from datetime import datetime, timezone
-from chrono_id import Chrono64s, Generator, Persona
+from chrono_id import ChronoError, Chrono64s, Generator, Persona, UChrono32mo
 
 
 class TestGenerator(unittest.TestCase):
@@ -51,6 +51,27 @@ class TestGenerator(unittest.TestCase):
         self.assertNotEqual(id1, id2)
         self.assertNotEqual(gen.persona.node_id, p1_node)
 
+    def test_wall_clock_matches_explicit_dt(self):
+        # The dt=None fast path must bucket like TS_COMPUTE on datetime.now().
+        for cls in (Chrono64s, UChrono32mo):
+            with self.subTest(cls=cls.__name__):
+                gen = Generator(cls)
+                before = cls._ts_compute(datetime.now(timezone.utc))
+                gen.generate()
+                after = cls._ts_compute(datetime.now(timezone.utc))
+                self.assertTrue(before <= gen.last_ts <= after)
+
+    def test_underflow_leaves_state_intact(self):
+        gen = Generator(Chrono64s)
+        dt = datetime(2023, 1, 1, 12, 0, 0, tzinfo=timezone.utc)
+        expected = Chrono64s.from_persona(dt, gen.persona.node_id, 0, gen.persona)
+        self.assertEqual(gen.generate(dt=dt), expected)
+
+        with self.assertRaisesRegex(ChronoError, "Date is before Epoch"):
+            gen.generate(dt=datetime(2019, 12, 31, 23, 59, 59, tzinfo=timezone.utc))
+        self.assertEqual(gen.last_ts, Chrono64s._ts_compute(dt))
+        self.assertEqual(gen.sequence, 0)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -1,3 +1,4 @@
+import functools
 import json
 import unittest
 import os
@@ -46,14 +47,41 @@ from chrono_id import (
 )
 
 
+@functools.lru_cache(maxsize=2048)
+def _parse_iso(iso):
+    # Vectors repeat the same instants across variants: parse each once.
+    return datetime.fromisoformat(iso[:-1] + "+00:00" if iso.endswith("Z") else iso)
+
+
+def _fixed_hex(cls, value):
+    # Fixed-width wire hex, so the comparison doesn't hinge on how the vector
+    # file happened to pad (or not pad) leading zeros.
+    return value.to_bytes(cls.BYTE_WIDTH, "big").hex()
+
+
+def _vector_hex(cls, literal):
+    # The vector's own hex digits at the same width, compared as text: a
+    # malformed literal (bad digits, too wide) fails instead of round-tripping.
+    digits = literal[2:] if literal.startswith("0x") else literal
+    return digits.lower().zfill(cls.BYTE_WIDTH * 2)
+
+
+VECTORS_PATH = os.path.join(
+    os.path.dirname(__file__), "../../../tests/cross_platform_tests.json"
+)
+
+
+@functools.lru_cache(maxsize=None)
+def _load_vectors(path):
+    # Parsed once per process, however many test classes read the vectors.
+    with open(path, "rb") as f:
+        return json.load(f)
+
+
 class TestCrossPlatformJSON(unittest.TestCase):
     @classmethod
     def setUpClass(cls):
-        path = os.path.join(
-            os.path.dirname(__file__), "../../../tests/cross_platform_tests.json"
-        )
-        with open(path, "r") as f:
-            cls.data = json.load(f)
+        cls.data = _load_vectors(VECTORS_PATH)
 
         cls.variant_map = {
             "chrono32d": Chrono32d,
@@ -99,50 +127,56 @@ class TestCrossPlatformJSON(unittest.TestCase):
     def test_valid_cases(self):
         from chrono_id.core import Persona
 
+        # One list comparison instead of a subTest per vector: the keys pin
+        # down the first mismatching case in the assertEqual diff.
+        got, want = [], []
         for case in self.data["valid_cases"]:
             iso = case["iso"]
             for v_data in case["variants"]:
                 v_name = v_data["name"]
-                if v_name not in self.variant_map:
+                cls = self.variant_map.get(v_name)
+                if cls is None:
                     continue
-                cls = self.variant_map[v_name]
-                with self.subTest(iso=iso, variant=v_name):
-                    if "node_idx" in v_data:
-                        iso_clean = iso.replace("Z", "+00:00")
-                        dt = datetime.fromisoformat(iso_clean)
-                        p = Persona(s_bits=cls.S_BITS)
-                        p.node_id = v_data.get("node_id", 0)
-                        p.node_salt = v_data.get("node_salt", 0)
-                        p.node_idx = v_data.get("node_idx", 0)
-                        p.seq_offset = v_data.get("seq_offset", 0)
-                        p.seq_idx = v_data.get("seq_idx", 0)
-                        p.seq_salt = v_data.get("seq_salt", 0)
-
-                        obj = cls.from_persona(
-                            dt=dt,
-                            node_id=p.node_id,
-                            seq=v_data.get("seq", 0),
-                            persona=p,
-                        )
-                    else:
-                        obj = cls.from_iso_string(iso)
-
-                    if "expected_timestamp" in v_data:
-                        ts_val = int(obj) >> (cls.N_BITS + cls.S_BITS)
-                        self.assertEqual(ts_val, v_data["expected_timestamp"])
-                    if "expected_iso" in v_data:
-                        self.assertEqual(obj.to_iso_string(), v_data["expected_iso"])
-                    if "expected_hex" in v_data:
-                        self.assertEqual(hex(obj), v_data["expected_hex"])
-                    if "expected_str" in v_data:
-                        self.assertEqual(str(obj), v_data["expected_str"])
+                if "node_idx" in v_data:
+                    dt = _parse_iso(iso)
+                    p = Persona(s_bits=cls.S_BITS)
+                    p.node_id = v_data.get("node_id", 0)
+                    p.node_salt = v_data.get("node_salt", 0)
+                    p.node_idx = v_data.get("node_idx", 0)
+                    p.seq_offset = v_data.get("seq_offset", 0)
+                    p.seq_idx = v_data.get("seq_idx", 0)
+                    p.seq_salt = v_data.get("seq_salt", 0)
+
+                    obj = cls.from_persona(
+                        dt=dt,
+                        node_id=p.node_id,
+                        seq=v_data.get("seq", 0),
+                        persona=p,
+                    )
+                else:
+                    obj = cls.from_iso_string(iso)
+
+                key = (iso, v_name)
+                if "expected_timestamp" in v_data:
+                    got.append(key + ("timestamp", int(obj) >> cls.T_SHIFT))
+                    want.append(key + ("timestamp", v_data["expected_timestamp"]))
+                if "expected_iso" in v_data:
+                    got.append(key + ("iso", obj.to_iso_string()))
+                    want.append(key + ("iso", v_data["expected_iso"]))
+                if "expected_hex" in v_data:
+                    got.append(key + ("hex", _fixed_hex(cls, obj)))
+                    want.append(key + ("hex", _vector_hex(cls, v_data["expected_hex"])))
+                if "expected_str" in v_data:
+                    got.append(key + ("str", str(obj)))
+                    want.append(key + ("str", v_data["expected_str"]))
+        self.assertEqual(got, want)
 
     def test_precision_checks(self):
         for check in self.data["precision_checks"]:
             v_name = check["variant"]
-            if v_name not in self.variant_map:
+            cls = self.variant_map.get(v_name)
+            if cls is None:
                 continue
-            cls = self.variant_map[v_name]
             with self.subTest(variant=v_name, input=check["input_iso"]):
                 obj = cls.from_iso_string(check["input_iso"])
                 self.assertEqual(obj.to_iso_string(), check["expected_iso"])
@@ -150,9 +184,9 @@ class TestCrossPlatformJSON(unittest.TestCase):
     def test_error_cases(self):
         for case in self.data["error_cases"]:
             v_name = case.get("variant", "chrono64ms")
-            if v_name not in self.variant_map:
+            cls = self.variant_map.get(v_name)
+            if cls is None:
                 continue
-            cls = self.variant_map[v_name]
             input_val = case["input"]
             expected_err = case["expected_error"]
             with self.subTest(name=case["name"]):
@@ -162,51 +196,54 @@ class TestCrossPlatformJSON(unittest.TestCase):
     def test_bit_splits(self):
         if "bit_splits" not in self.data:
             return
+        got, want = [], []
         for case in self.data["bit_splits"]:
             v_name = case["variant"]
-            if v_name not in self.variant_map:
+            cls = self.variant_map.get(v_name)
+            if cls is None:
                 continue
-            cls = self.variant_map[v_name]
-
-            with self.subTest(desc=case.get("description", v_name)):
-                iso = case.get("iso", "2023-01-01T00:00:00Z")
-                iso_clean = iso.replace("Z", "+00:00")
-                dt = datetime.fromisoformat(iso_clean)
-                node_id = case.get("node_id", 0)
-                seq = case.get("seq", 0)
-
-                # Use from_parts with salt=0 for raw bit check
-                obj = cls.from_parts(dt, node_id, seq, p_idx=0, salt=0)
-                self.assertEqual(hex(obj), case["expected_hex"])
-
-                val = int(obj)
-                if "expected_timestamp_bits" in case:
-                    ts_val = val >> (cls.N_BITS + cls.S_BITS)
-                    ts_bin = bin(ts_val)[2:].zfill(cls.T_BITS)
-                    self.assertEqual(ts_bin, case["expected_timestamp_bits"])
-
-                if "expected_node_bits" in case:
-                    # Note: this check only works if we know the multiplier results
-                    # The JSON expected_node_bits already accounts for mixing in my generation.
-                    n_mix = (val >> cls.S_BITS) & (
-                        (1 << cls.N_BITS) - 1 if cls.N_BITS > 0 else 0
-                    )
-                    n_bin = bin(n_mix)[2:].zfill(cls.N_BITS)
-                    self.assertEqual(n_bin, case["expected_node_bits"])
 
-                if "expected_seq_bits" in case:
-                    s_mix = val & ((1 << cls.S_BITS) - 1 if cls.S_BITS > 0 else 0)
-                    s_bin = bin(s_mix)[2:].zfill(cls.S_BITS)
-                    self.assertEqual(s_bin, case["expected_seq_bits"])
+            key = (case.get("description", v_name),)
+            iso = case.get("iso", "2023-01-01T00:00:00Z")
+            dt = _parse_iso(iso)
+            node_id = case.get("node_id", 0)
+            seq = case.get("seq", 0)
+
+            # Use from_parts with salt=0 for raw bit check
+            obj = cls.from_parts(dt, node_id, seq, p_idx=0, salt=0)
+            got.append(key + ("hex", _fixed_hex(cls, obj)))
+            want.append(key + ("hex", _vector_hex(cls, case["expected_hex"])))
+
+            val = int(obj)
+            if "expected_timestamp_bits" in case:
+                ts_val = val >> cls.T_SHIFT
+                ts_bin = format(ts_val, f"0{cls.T_BITS}b")
+                got.append(key + ("timestamp_bits", ts_bin))
+                want.append(key + ("timestamp_bits", case["expected_timestamp_bits"]))
+
+            if "expected_node_bits" in case:
+                # Note: this check only works if we know the multiplier results
+                # The JSON expected_node_bits already accounts for mixing in my generation.
+                n_mix = (val >> cls.S_BITS) & cls.N_MASK
+                n_bin = format(n_mix, f"0{cls.N_BITS}b")
+                got.append(key + ("node_bits", n_bin))
+                want.append(key + ("node_bits", case["expected_node_bits"]))
+
+            if "expected_seq_bits" in case:
+                s_mix = val & cls.S_MASK
+                s_bin = format(s_mix, f"0{cls.S_BITS}b")
+                got.append(key + ("seq_bits", s_bin))
+                want.append(key + ("seq_bits", case["expected_seq_bits"]))
+        self.assertEqual(got, want)
 
     def test_variant_specs(self):
         if "variant_specs" not in self.data:
             return
         for spec in self.data["variant_specs"]:
             v_name = spec["variant"]
-            if v_name not in self.variant_map:
+            cls = self.variant_map.get(v_name)
+            if cls is None:
                 continue
-            cls = self.variant_map[v_name]
 
             with self.subTest(variant=v_name):
                 self.assertEqual(
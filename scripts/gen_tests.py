@@ -17,19 +17,10 @@ def generate_exhaustive() -> None:
     test_json_path = os.path.join(project_root, "tests/cross_platform_tests.json")
 
     sys.path.append(py_src)
-    from chrono_id.core import ChronoBase, Persona, TS_COMPUTE
+    from chrono_id.core import ChronoBase, Persona, TS_COMPUTE, VARIANTS
 
-    # Automated Variant Discovery
-    variants: List[Type[ChronoBase]] = []
-
-    def find_subclasses(cls: Type[ChronoBase]) -> None:
-        for sub in cls.__subclasses__():
-            if hasattr(sub, "T_BITS") and sub.__name__ != "ChronoBasebs":
-                variants.append(sub)
-            find_subclasses(sub)
-
-    find_subclasses(ChronoBase)
-    variants.sort(key=lambda x: x.__name__.lower())
+    # Automated Variant Discovery (registered at class definition)
+    variants: List[Type[ChronoBase]] = [VARIANTS[k] for k in sorted(VARIANTS)]
 
     # Load Existing Data to preserve manual scenarios
     existing_data: Dict[str, Any] = {}
@@ -68,18 +59,24 @@ def generate_exhaustive() -> None:
         "variants": [],
     }
 
+    # One Persona per variant, overwritten in place for each index. Every
+    # field is reassigned below, so no state carries over between indices.
+    personas = {v: Persona(v.S_BITS) for v in variants}
+
     for i in range(128):
         v = variants[i % len(variants)]
-        p = Persona(v.S_BITS)
+        p = personas[v]
         p.node_id = 0x123 + i
         p.node_idx = i
         p.node_salt = 0x456 + i
         p.seq_idx = (i + 50) % 128
         p.seq_salt = 0x321 + i
-        p.seq_offset = (0x789 + i) & ((1 << v.S_BITS) - 1) if v.S_BITS > 0 else 0
+        # S_MASK is 0 when S_BITS is 0, so no special case is needed.
+        p.seq_offset = (0x789 + i) & v.S_MASK
 
-        seq = (456 + i) & ((1 << v.S_BITS) - 1) if v.S_BITS > 0 else 0
+        seq = (456 + i) & v.S_MASK
         obj = v.from_parts(dt, p.node_id, seq, persona=p)
+        raw = int(obj)
 
         exhaustive_case["variants"].append(
             {
@@ -91,7 +88,7 @@ def generate_exhaustive() -> None:
                 "seq_idx": p.seq_idx,
                 "seq_salt": p.seq_salt,
                 "seq_offset": p.seq_offset,
-                "expected_hex": hex(int(obj)),
+                "expected_hex": f"0x{raw:x}",
                 "expected_str": str(obj),
             }
         )
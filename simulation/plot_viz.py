@@ -1,82 +1,86 @@
 import pandas as pd
+import matplotlib
+matplotlib.use('Agg')  # Headless batch rendering: skip GUI backend discovery
 import matplotlib.pyplot as plt
+import argparse
 import os
 import numpy as np
 
-def plot_entropy_decay():
+def needs_rebuild(csv, png):
+    """True if 'png' is missing or older than the 'csv' it is rendered from."""
+    return not os.path.exists(png) or os.path.getmtime(png) < os.path.getmtime(csv)
+
+def plot_entropy_decay(ax):
     df = pd.read_csv('data/entropy_decay.csv')
-    plt.figure(figsize=(10, 6))
-    plt.plot(df['ids'], df['standard_distributed'], marker='o', color='red', label='Standard Distributed (Snowflake)')
-    plt.plot(df['ids'], df['chronoid'], marker='s', color='blue', label='ChronoID (Active Divergence)')
+    ax.plot(df['ids'], df['standard_distributed'], marker='o', color='red', label='Standard Distributed (Snowflake)')
+    ax.plot(df['ids'], df['chronoid'], marker='s', color='blue', label='ChronoID (Active Divergence)')
 
-    plt.title('Empirical Graph A: Collision Resistance vs Scale')
-    plt.xlabel('Concurrent Node Count (Simulated)')
-    plt.ylabel('Observed Collision Probability (%)')
-    plt.legend()
-    plt.grid(True, which="both", ls="-", alpha=0.3)
+    ax.set_title('Empirical Graph A: Collision Resistance vs Scale')
+    ax.set_xlabel('Concurrent Node Count (Simulated)')
+    ax.set_ylabel('Observed Collision Probability (%)')
+    ax.legend()
+    ax.grid(True, which="both", ls="-", alpha=0.3)
 
     # Format x-axis
-    plt.xticks(df['ids'], [f'{int(x/1000)}k' for x in df['ids']])
+    ax.set_xticks(df['ids'])
+    ax.set_xticklabels([f'{int(x/1000)}k' for x in df['ids']])
 
-    plt.savefig('plots/entropy_decay.png')
+    ax.figure.savefig('plots/entropy_decay.png')
     print("✅ Saved plots/entropy_decay.png")
 
-def plot_throughput_cliff():
+def plot_throughput_cliff(ax):
     df = pd.read_csv('data/throughput_cliff.csv')
-    plt.figure(figsize=(10, 6))
-    plt.plot(df['rows'], df['uuid'], marker='o', color='red', label='UUIDv7 (Random B-Tree)')
-    plt.plot(df['rows'], df['chronoid'], marker='s', color='blue', label='ChronoID (Sequential B-Tree)')
+    ax.plot(df['rows'], df['uuid'], marker='o', color='red', label='UUIDv7 (Random B-Tree)')
+    ax.plot(df['rows'], df['chronoid'], marker='s', color='blue', label='ChronoID (Sequential B-Tree)')
 
-    plt.title('Empirical Graph B: Ingestion Velocity & B-Tree Fragmentation')
-    plt.xlabel('Database Scale (Cumulative Record Count)')
-    plt.ylabel('Tail Latency (ms per 200k Insertions)')
-    plt.ylim(bottom=0)
-    plt.legend()
-    plt.grid(True, which="both", ls="-", alpha=0.3)
+    ax.set_title('Empirical Graph B: Ingestion Velocity & B-Tree Fragmentation')
+    ax.set_xlabel('Database Scale (Cumulative Record Count)')
+    ax.set_ylabel('Tail Latency (ms per 200k Insertions)')
+    ax.set_ylim(bottom=0)
+    ax.legend()
+    ax.grid(True, which="both", ls="-", alpha=0.3)
 
     # Format x-axis
-    plt.xticks(df['rows'], [f'{x/1_000_000:.1f}M' for x in df['rows']])
+    ax.set_xticks(df['rows'])
+    ax.set_xticklabels([f'{x/1_000_000:.1f}M' for x in df['rows']])
 
-    plt.savefig('plots/throughput_cliff.png')
+    ax.figure.savefig('plots/throughput_cliff.png')
     print("✅ Saved plots/throughput_cliff.png")
 
-def plot_storage_footprint():
+def plot_storage_footprint(ax):
     df = pd.read_csv('data/storage_footprint.csv')
-    plt.figure(figsize=(10, 6))
-    bars = plt.bar(df['type'], df['size_gb'], color=['red', 'orange', 'blue'])
+    bars = ax.bar(df['type'], df['size_gb'], color=['red', 'orange', 'blue'])
 
-    plt.title('Empirical Graph C: Physical Index Footprint (100M Scale)')
-    plt.ylabel('Total Storage Volume (GB)')
-    plt.grid(axis='y', ls="-", alpha=0.3)
+    ax.set_title('Empirical Graph C: Physical Index Footprint (100M Scale)')
+    ax.set_ylabel('Total Storage Volume (GB)')
+    ax.grid(axis='y', ls="-", alpha=0.3)
 
     # Add data labels
     for bar in bars:
         yval = bar.get_height()
-        plt.text(bar.get_x() + bar.get_width()/2, yval + 0.1, f'{yval} GB', ha='center', va='bottom', fontweight='bold')
+        ax.text(bar.get_x() + bar.get_width()/2, yval + 0.1, f'{yval} GB', ha='center', va='bottom', fontweight='bold')
 
-    plt.savefig('plots/storage_footprint.png')
+    ax.figure.savefig('plots/storage_footprint.png')
     print("✅ Saved plots/storage_footprint.png")
 
-def plot_storage_tenant():
+def plot_storage_tenant(ax):
     df = pd.read_csv('data/storage_tenant.csv')
-    plt.figure(figsize=(10, 6))
-    bars = plt.bar(df['type'], df['size_mb'], color=['red', 'orange', 'green'])
+    bars = ax.bar(df['type'], df['size_mb'], color=['red', 'orange', 'green'])
 
-    plt.title('Empirical Graph D: Multi-Tenant Density (Full 16.7M IDs in Mode B)')
-    plt.ylabel('Index Memory Footprint (MB)')
-    plt.grid(axis='y', ls="-", alpha=0.3)
+    ax.set_title('Empirical Graph D: Multi-Tenant Density (Full 16.7M IDs in Mode B)')
+    ax.set_ylabel('Index Memory Footprint (MB)')
+    ax.grid(axis='y', ls="-", alpha=0.3)
 
     # Add data labels
     for bar in bars:
         yval = bar.get_height()
-        plt.text(bar.get_x() + bar.get_width()/2, yval + 0.1, f'{yval} MB', ha='center', va='bottom', fontweight='bold')
+        ax.text(bar.get_x() + bar.get_width()/2, yval + 0.1, f'{yval} MB', ha='center', va='bottom', fontweight='bold')
 
-    plt.savefig('plots/storage_tenant.png')
+    ax.figure.savefig('plots/storage_tenant.png')
     print("✅ Saved plots/storage_tenant.png")
 
-def plot_routing_efficiency():
+def plot_routing_efficiency(ax):
     df = pd.read_csv('data/routing_efficiency.csv')
-    plt.figure(figsize=(10, 6))
 
     scales = df['scale'].unique()
     types = df['type'].unique()
@@ -87,68 +91,92 @@ def plot_routing_efficiency():
     map_times = df[df['type'] == 'Map Lookup']['time_ms'].values
     shift_times = df[df['type'] == 'Bit-Shift']['time_ms'].values
 
-    plt.bar(x - width/2, map_times, width, label='Map Lookup', color='grey')
-    plt.bar(x + width/2, shift_times, width, label='Bit-Shift', color='blue')
+    ax.bar(x - width/2, map_times, width, label='Map Lookup', color='grey')
+    ax.bar(x + width/2, shift_times, width, label='Bit-Shift', color='blue')
 
-    plt.title('Empirical Graph E: Shard Routing Execution Cost')
-    plt.xlabel('Routing Request Volume (Deterministic Suffix)')
-    plt.ylabel('CPU Processing Time (ms) - Log Scale')
-    plt.xticks(x, scales)
-    plt.yscale('log')
-    plt.legend()
-    plt.grid(axis='y', ls="-", alpha=0.3)
+    ax.set_title('Empirical Graph E: Shard Routing Execution Cost')
+    ax.set_xlabel('Routing Request Volume (Deterministic Suffix)')
+    ax.set_ylabel('CPU Processing Time (ms) - Log Scale')
+    ax.set_xticks(x)
+    ax.set_xticklabels(scales)
+    ax.set_yscale('log')
+    ax.legend()
+    ax.grid(axis='y', ls="-", alpha=0.3)
 
     # Add data labels
     for i, scale in enumerate(scales):
-        plt.text(i - width/2, map_times[i] * 1.05, f'{map_times[i]:.1f}ms', ha='center', va='bottom', fontsize=8)
-        plt.text(i + width/2, shift_times[i] * 1.05, f'{shift_times[i]:.3f}ms', ha='center', va='bottom', fontsize=8, color='blue', fontweight='bold')
+        ax.text(i - width/2, map_times[i] * 1.05, f'{map_times[i]:.1f}ms', ha='center', va='bottom', fontsize=8)
+        ax.text(i + width/2, shift_times[i] * 1.05, f'{shift_times[i]:.3f}ms', ha='center', va='bottom', fontsize=8, color='blue', fontweight='bold')
 
-    plt.savefig('plots/routing_efficiency.png')
+    ax.figure.savefig('plots/routing_efficiency.png')
     print("✅ Saved plots/routing_efficiency.png")
 
-def plot_register_performance():
+def plot_register_performance(ax):
     df = pd.read_csv('data/register_performance.csv')
-    plt.figure(figsize=(10, 6))
-    bars = plt.bar(df['type'], df['ops_per_ms'], color=['blue', 'grey'])
+    bars = ax.bar(df['type'], df['ops_per_ms'], color=['blue', 'grey'])
     
-    plt.title('Empirical Graph G: CPU Throughput (Integer vs String)')
-    plt.ylabel('Operations per Millisecond')
-    plt.grid(axis='y', ls="-", alpha=0.3)
+    ax.set_title('Empirical Graph G: CPU Throughput (Integer vs String)')
+    ax.set_ylabel('Operations per Millisecond')
+    ax.grid(axis='y', ls="-", alpha=0.3)
     
     # Add data labels
     for bar in bars:
         yval = bar.get_height()
-        plt.text(bar.get_x() + bar.get_width()/2, yval + 10, f'{int(yval):,} ops/ms', ha='center', va='bottom', fontweight='bold')
+        ax.text(bar.get_x() + bar.get_width()/2, yval + 10, f'{int(yval):,} ops/ms', ha='center', va='bottom', fontweight='bold')
 
-    plt.savefig('plots/register_performance.png')
+    ax.figure.savefig('plots/register_performance.png')
     print("✅ Saved plots/register_performance.png")
 
-def plot_avalanche():
+def plot_avalanche(ax):
     df = pd.read_csv('data/avalanche_diffusion.csv')
-    plt.figure(figsize=(10, 6))
-    plt.bar(df['bit'], df['diffusion'], color='teal', alpha=0.7)
+    ax.bar(df['bit'], df['diffusion'], color='teal', alpha=0.7)
     
-    plt.title('Empirical Graph H: Avalanche Diffusion Efficiency')
-    plt.xlabel('Input Bit Position (Entropy/Sequence)')
-    plt.ylabel('Diffusion Probability (%)')
-    plt.ylim(0, 100)
-    plt.grid(axis='y', ls="-", alpha=0.3)
+    ax.set_title('Empirical Graph H: Avalanche Diffusion Efficiency')
+    ax.set_xlabel('Input Bit Position (Entropy/Sequence)')
+    ax.set_ylabel('Diffusion Probability (%)')
+    ax.set_ylim(0, 100)
+    ax.grid(axis='y', ls="-", alpha=0.3)
     
     # Reference lines
-    plt.axhline(y=50, color='red', linestyle='--', label='Ideal (50%)')
-    plt.axhline(y=30, color='orange', linestyle='--', label='Target (30%)')
-    plt.legend()
+    ax.axhline(y=50, color='red', linestyle='--', label='Ideal (50%)')
+    ax.axhline(y=30, color='orange', linestyle='--', label='Target (30%)')
+    ax.legend()
 
-    plt.savefig('plots/avalanche_diffusion.png')
+    ax.figure.savefig('plots/avalanche_diffusion.png')
     print("✅ Saved plots/avalanche_diffusion.png")
 
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Render the simulation graphs")
+    parser.add_argument("--force", action="store_true", help="Re-render plots that are already up to date")
+    args = parser.parse_args()
+
     if not os.path.exists('plots'):
         os.makedirs('plots')
-    plot_entropy_decay()
-    plot_throughput_cliff()
-    plot_storage_footprint()
-    plot_storage_tenant()
-    plot_routing_efficiency()
-    plot_register_performance()
-    plot_avalanche()
+
+    # Each graph renders data/<name>.csv into plots/<name>.png.
+    plots = [
+        ('entropy_decay', plot_entropy_decay),
+        ('throughput_cliff', plot_throughput_cliff),
+        ('storage_footprint', plot_storage_footprint),
+        ('storage_tenant', plot_storage_tenant),
+        ('routing_efficiency', plot_routing_efficiency),
+        ('register_performance', plot_register_performance),
+        ('avalanche_diffusion', plot_avalanche),
+    ]
+    if not args.force:
+        stale = []
+        for name, plot in plots:
+            if needs_rebuild(f'data/{name}.csv', f'plots/{name}.png'):
+                stale.append((name, plot))
+            else:
+                print(f"⏭️  Skipped plots/{name}.png (newer than data/{name}.csv)")
+        plots = stale
+
+    # One figure for every graph: each plot draws on the shared axes, saves,
+    # and the axes are cleared for the next one.
+    if plots:
+        fig, ax = plt.subplots(figsize=(10, 6))
+        for name, plot in plots:
+            plot(ax)
+            ax.clear()
+        plt.close(fig)
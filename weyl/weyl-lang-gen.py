@@ -11,9 +11,10 @@ import os
 import argparse
 
 
-def generate_source(mults, lang):
+def generate_source(mults, lang, out):
     """
-    Dispatches the correct code emitter based on the target language.
+    Dispatches the correct code emitter based on the target language,
+    writing the generated source to the open text file 'out'.
     """
     lang = lang.lower()
     count = len(mults)
@@ -21,23 +22,22 @@ def generate_source(mults, lang):
     def emit_array(header, footer, item_suffix="", items_per_line=4, comment=None):
         """
         Generic helper to format a 1D array/list into a multi-line source block.
+        Rows are streamed to 'out' as they are formatted.
         """
-        lines = []
+        # Normalize to lowercase hex for code consistency, suffixing each
+        # literal once up front so every row is just a slice.
+        items = [m.lower() + item_suffix for m in mults]
         if comment:
-            lines.append(comment)
-        lines.append(header)
+            out.write(comment + "\n")
+        out.write(header + "\n")
         for i in range(0, count, items_per_line):
-            # Normalize to lowercase hex for code consistency
-            batch = [m.lower() + item_suffix for m in mults[i : i + items_per_line]]
-            line = "    " + ", ".join(batch) + ","
-            lines.append(line)
-        lines.append(footer)
-        return "\n".join(lines)
+            out.write("    " + ", ".join(items[i : i + items_per_line]) + ",\n")
+        out.write(footer + "\n")
 
     # Rust: pub const WEYL_MULTIPLIERS: [u64; 128] = [...]
     if lang == "rust":
         # Rustfmt usually handles arrays fine, but we can add an ignore if needed.
-        return emit_array(
+        emit_array(
             f"pub const WEYL_MULTIPLIERS: [u64; {count}] = [",
             "];",
             comment="#[rustfmt::skip]",
@@ -45,7 +45,7 @@ def generate_source(mults, lang):
 
     # JavaScript/TypeScript: export const WEYL_MULTIPLIERS = [1n, ...] (BigInt)
     elif lang in ["js", "javascript", "ts", "typescript"]:
-        return emit_array(
+        emit_array(
             "export const WEYL_MULTIPLIERS = [",
             "];",
             item_suffix="n",
@@ -54,7 +54,7 @@ def generate_source(mults, lang):
 
     # C/C++: const uint64_t WEYL_MULTIPLIERS[128] = {1ULL, ...}
     elif lang in ["cpp", "c++", "c"]:
-        return emit_array(
+        emit_array(
             f"const uint64_t WEYL_MULTIPLIERS[{count}] = {{",
             "};",
             item_suffix="ULL",
@@ -63,18 +63,19 @@ def generate_source(mults, lang):
 
     # Python: WEYL_MULTIPLIERS = [...]
     elif lang == "python":
-        return emit_array("WEYL_MULTIPLIERS = [", "]", comment="# fmt: off")
+        emit_array("WEYL_MULTIPLIERS = [", "]", comment="# fmt: off")
 
     # Odin: WEYL_MULTIPLIERS: [128]u64 = {...}
     elif lang == "odin":
-        return emit_array(f"WEYL_MULTIPLIERS: [{count}]u64 = {{", "}")
+        emit_array(f"WEYL_MULTIPLIERS: [{count}]u64 = {{", "}")
 
     # Go: var WeylMultipliers = [128]uint64{...}
     elif lang == "go":
-        return emit_array(f"var WeylMultipliers = [{count}]uint64{{", "}")
+        emit_array(f"var WeylMultipliers = [{count}]uint64{{", "}")
 
     else:
-        return f"// Unsupported language: {lang}\n" + "\n".join(mults)
+        out.write(f"// Unsupported language: {lang}\n")
+        out.writelines(m + "\n" for m in mults)
 
 
 def main():
@@ -154,9 +155,8 @@ Examples:
 
     # 4. Generate and Write
     try:
-        output = generate_source(mults, args.language)
         with open(args.output, "w") as f:
-            f.write(output + "\n")
+            generate_source(mults, args.language, f)
         print(
             f"✅ Success: Generated {len(mults)} multipliers for {args.language} -> {args.output}"
         )
@@ -7,17 +7,26 @@ for the Weyl-Golden mixers in uncoordinated distributed systems.
 """
 
 import math
-import random
 from decimal import Decimal, getcontext
 
+try:
+    import gmpy2
+except ImportError:  # Optional: falls back to the pure-Python test below
+    gmpy2 = None
+
 # Set precision high enough for 64-bit integer conversion
 getcontext().prec = 30
 
 
-def is_prime(n, k=10):
+# Miller-Rabin witnesses that are deterministic for every n < 3.3 * 10^24,
+# which covers the whole 64-bit range.
+MR_WITNESSES = (2, 3, 5, 7, 11, 13, 17, 19, 23, 29, 31, 37)
+
+
+def is_prime(n):
     """
-    Performs the Miller-Rabin primality test.
-    k is the number of iterations; 10 is sufficient for 64-bit numbers.
+    Performs the Miller-Rabin primality test with the fixed MR_WITNESSES,
+    which gives a deterministic answer for 64-bit numbers.
     """
     if n <= 1:
         return False
@@ -31,8 +40,9 @@ def is_prime(n, k=10):
     while d % 2 == 0:
         r += 1
         d //= 2
-    for _ in range(k):
-        a = random.randint(2, n - 2)
+    for a in MR_WITNESSES:
+        if a >= n:
+            continue
         x = pow(a, d, n)
         if x == 1 or x == n - 1:
             continue
@@ -45,19 +55,37 @@ def is_prime(n, k=10):
     return True
 
 
+# Odd primes for the trial-division prefilter in get_next_prime.
+SMALL_PRIMES = (3, 5, 7, 11, 13, 17, 19, 23, 29, 31, 37, 41, 43, 47)
+
+
+def has_small_factor(n):
+    """
+    Cheap compositeness check: True if a small odd prime (other than n itself)
+    divides n. Rejects most odd candidates before any modular exponentiation.
+    """
+    return any(n % p == 0 for p in SMALL_PRIMES if p < n)
+
+
 def get_next_prime(n):
     """
     Finds the smallest prime p >= n.
     """
+    if gmpy2 is not None:
+        # GMP's next_prime is strictly greater than its argument.
+        return int(gmpy2.next_prime(n - 1))
     if n % 2 == 0:
         n += 1
-    while not is_prime(n):
+    while has_small_factor(n) or not is_prime(n):
         n += 2
     return n
 
 
 # --- Constant Derivation using high-precision Decimal ---
 
+# Scale factor shared by PHI and STEP: fractions of the 64-bit circle.
+TWO_64 = Decimal(1 << 64)
+
 # 1. Starting Point: The Golden Ratio (Phi)
 # PHI = floor(2^64 * (sqrt(5)-1)/2)
 #
@@ -70,7 +98,7 @@ def get_next_prime(n):
 #
 # Derived from: (sqrt(5) - 1) / 2 = 0.6180339887...
 phi_inv = (Decimal(5).sqrt() - 1) / 2
-PHI = int(phi_inv * Decimal(2**64))
+PHI = int(phi_inv * TWO_64)
 
 # 2. Spacing Step: The Silver Ratio base (sqrt(2))
 # STEP = floor(2^64 * (sqrt(2)-1))
@@ -93,7 +121,7 @@ PHI = int(phi_inv * Decimal(2**64))
 #    phi-based starting point, ensuring each of the 128 primes is found in a
 #    mathematically unique neighborhood.
 step_raw = Decimal(2).sqrt() - 1
-STEP = int(step_raw * Decimal(2**64))
+STEP = int(step_raw * TWO_64)
 
 
 def main():